@@ -1,63 +1,273 @@
+import multiprocessing
 import os
+import queue
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
 
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+
+from game_logic import neighbor_table
+from streaming_stats import FixedHistogram, RunningStats
+
+
+class ReportCancelled(Exception):
+    """Raised when a report computation is cancelled part-way."""
+
 
 def neighbors(rows: int, cols: int, r: int, c: int):
-    for nr in range(max(0, r - 1), min(rows, r + 2)):
-        for nc in range(max(0, c - 1), min(cols, c + 2)):
-            if (nr, nc) != (r, c):
-                yield nr, nc
+    for nidx in neighbor_table(rows, cols).of(r * cols + c):
+        yield divmod(nidx, cols)
+
+
+def neighbor_sums(mine_mask: np.ndarray) -> np.ndarray:
+    """Mines among the 8 neighbours of every cell, over the last two axes.
+
+    Sums the 8 shifted views of a zero-padded copy, so a leading batch axis
+    is handled in the same handful of array operations.
+    """
+    mines = mine_mask.astype(np.int8)
+    rows, cols = mines.shape[-2:]
+    padded = np.pad(mines, [(0, 0)] * (mines.ndim - 2) + [(1, 1), (1, 1)])
+    total = np.zeros_like(mines)
+    for dr in range(3):
+        for dc in range(3):
+            if dr != 1 or dc != 1:
+                total += padded[..., dr:dr + rows, dc:dc + cols]
+    return total
 
 
 def count_neighbor_mines(mine_mask: np.ndarray) -> np.ndarray:
-    rows, cols = mine_mask.shape
-    numbers = np.zeros((rows, cols), dtype=np.int8)
-    for r in range(rows):
-        for c in range(cols):
-            if mine_mask[r, c]:
-                continue
-            numbers[r, c] = sum(mine_mask[nr, nc] for nr, nc in neighbors(rows, cols, r, c))
+    # A 0/1 integer mask would index rows below instead of masking cells.
+    mine_mask = np.asarray(mine_mask, dtype=bool)
+    numbers = neighbor_sums(mine_mask)
+    numbers[mine_mask] = 0
     return numbers
 
 
+def count_neighbor_mines_reference(mine_mask: np.ndarray) -> np.ndarray:
+    """Cell-by-cell version of count_neighbor_mines, kept for parity checks."""
+    rows, cols = mine_mask.shape
+    table = neighbor_table(rows, cols)
+    offsets, indices = table.offsets, table.indices
+    flat = mine_mask.ravel().tolist()
+    numbers = np.zeros(rows * cols, dtype=np.int8)
+    for idx, is_mine in enumerate(flat):
+        if is_mine:
+            continue
+        count = 0
+        for nidx in indices[offsets[idx]:offsets[idx + 1]]:
+            count += flat[nidx]
+        numbers[idx] = count
+    return numbers.reshape(rows, cols)
+
+
+def cluster_roots(batch: np.ndarray):
+    """Group the True cells of a (B, rows, cols) boolean batch into 8-connected clusters.
+
+    Returns (cells, roots): the flat indices of the True cells in C order,
+    and for each the compact id (position in `cells`) of its cluster's root.
+    Clusters never cross boards. Uses vectorised union-find: every edge
+    between adjacent cells hooks the larger root onto the smaller one, then
+    pointer jumping flattens the trees, repeated until no edge joins two
+    roots. Ids are int32 unless the batch has 2**31 cells or more.
+    """
+    boards, rows, cols = batch.shape
+    id_dtype = np.int32 if batch.size < 2**31 else np.int64
+    cells = np.flatnonzero(batch)
+    # Work on set cells only: index[i] is the compact id of cell i.
+    index = np.full(batch.shape, -1, dtype=id_dtype)
+    index[batch] = np.arange(cells.size, dtype=id_dtype)
+
+    sources, targets = [], []
+    # Each undirected edge once: right, down-left, down, down-right.
+    for dr, dc in ((0, 1), (1, -1), (1, 0), (1, 1)):
+        a_rows, b_rows = slice(0, rows - dr), slice(dr, rows)
+        a_cols = slice(max(0, -dc), cols - max(0, dc))
+        b_cols = slice(max(0, dc), cols - max(0, -dc))
+        both = batch[:, a_rows, a_cols] & batch[:, b_rows, b_cols]
+        sources.append(index[:, a_rows, a_cols][both])
+        targets.append(index[:, b_rows, b_cols][both])
+    del index
+    u = np.concatenate(sources)
+    v = np.concatenate(targets)
+
+    parent = np.arange(cells.size, dtype=id_dtype)
+    while u.size:
+        pu, pv = parent[u], parent[v]
+        joined = pu != pv
+        if not joined.any():
+            break
+        u, v, pu, pv = u[joined], v[joined], pu[joined], pv[joined]
+        # Both ends are roots here; when several edges hook the same root,
+        # one write wins and the rest are retried next round.
+        parent[np.maximum(pu, pv)] = np.minimum(pu, pv)
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    return cells, parent
+
+
+def label_clusters(masks: np.ndarray) -> np.ndarray:
+    """Label 8-connected groups of True cells on one board or a (B, rows, cols) batch.
+
+    Returns an integer array shaped like the input holding, for every True
+    cell, the flat index (into the whole batch) of its group's root, and -1
+    elsewhere. Labels never cross boards; see `cluster_roots`.
+    """
+    masks = np.asarray(masks, dtype=bool)
+    batch = masks.reshape((-1,) + masks.shape[-2:])
+    cells, roots = cluster_roots(batch)
+    labels = np.full(batch.size, -1, dtype=roots.dtype)
+    labels[cells] = cells[roots]
+    return labels.reshape(masks.shape)
+
+
+def label_mine_clusters(mine_masks: np.ndarray) -> np.ndarray:
+    """Label 8-connected mine clusters; see `label_clusters`."""
+    return label_clusters(mine_masks)
+
+
+def mine_cluster_stats(mine_masks: np.ndarray):
+    """Cluster counts per board and the size of every cluster in the batch.
+
+    Returns (counts, sizes): counts has one entry per board and sizes one
+    entry per cluster, ordered by board.
+    """
+    masks = np.asarray(mine_masks, dtype=bool)
+    batch = masks.reshape((-1,) + masks.shape[-2:])
+    cells, roots = cluster_roots(batch)
+    sizes_at_root = np.bincount(roots, minlength=cells.size)
+    root_ids = np.flatnonzero(sizes_at_root)
+    board_cells = batch.shape[1] * batch.shape[2]
+    counts = np.bincount(cells[root_ids] // board_cells, minlength=batch.shape[0])
+    return counts, sizes_at_root[root_ids]
+
+
+def opening_stats(mine_masks: np.ndarray, numbers: np.ndarray):
+    """3BV, opening count and opening sizes for one board or a batch.
+
+    An opening is an 8-connected group of zero cells together with the
+    numbered cells bordering it, which a single click reveals. 3BV, the
+    fewest clicks that clear a board, is the number of openings plus the
+    numbered cells that border no opening.
+
+    Returns (bbbv, openings, sizes): one 3BV and one opening count per
+    board, and the size of every opening in the batch, ordered by board.
+    """
+    masks = np.asarray(mine_masks, dtype=bool)
+    batch = masks.reshape((-1,) + masks.shape[-2:])
+    numbers = np.asarray(numbers).reshape(batch.shape)
+    boards, rows, cols = batch.shape
+    board_cells = rows * cols
+
+    safe = ~batch
+    zeros = safe & (numbers == 0)
+    numbered = safe & ~zeros
+    del safe
+    # Everything below is indexed by compact zero-cell ids, so no array
+    # other than the masks spans the whole batch.
+    cells, roots = cluster_roots(zeros)
+    sizes_at_root = np.bincount(roots, minlength=cells.size)
+    root_ids = np.flatnonzero(sizes_at_root)
+    openings = np.bincount(cells[root_ids] // board_cells, minlength=boards)
+
+    # A numbered cell borders an opening iff one of its neighbours is zero.
+    border = numbered & (neighbor_sums(zeros) > 0)
+    bbbv = openings + (numbered & ~border).sum(axis=(1, 2))
+
+    # Gather the 8 neighbour root ids of every border cell from a -1 padded
+    # grid. A border cell can touch one opening from several sides, so only
+    # distinct ids per row are counted towards opening sizes.
+    padded = np.full((boards, rows + 2, cols + 2), -1, dtype=roots.dtype)
+    padded[:, 1:-1, 1:-1][zeros] = roots
+    width = cols + 2
+    board, r, c = np.nonzero(border)
+    at = board * (rows + 2) * width + (r + 1) * width + (c + 1)
+    steps = np.array([dr * width + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc])
+    around = np.sort(padded.ravel()[at[:, None] + steps[None, :]], axis=1)
+    distinct = np.ones(around.shape, dtype=bool)
+    distinct[:, 1:] = around[:, 1:] != around[:, :-1]
+    touched = around[distinct & (around >= 0)]
+    sizes_at_root += np.bincount(touched, minlength=cells.size)
+    return bbbv, openings, sizes_at_root[root_ids]
+
+
 def count_mine_clusters(mine_mask: np.ndarray) -> int:
+    counts, _ = mine_cluster_stats(mine_mask)
+    return int(counts[0])
+
+
+def count_mine_clusters_reference(mine_mask: np.ndarray) -> int:
+    """Depth-first version of count_mine_clusters, kept for parity checks."""
     rows, cols = mine_mask.shape
-    visited = np.zeros_like(mine_mask, dtype=bool)
+    table = neighbor_table(rows, cols)
+    offsets, indices = table.offsets, table.indices
+    flat = mine_mask.ravel().tolist()
+    visited = bytearray(rows * cols)
     clusters = 0
 
-    for r in range(rows):
-        for c in range(cols):
-            if not mine_mask[r, c] or visited[r, c]:
-                continue
-            clusters += 1
-            stack = [(r, c)]
-            visited[r, c] = True
-
-            while stack:
-                cr, cc = stack.pop()
-                for nr, nc in neighbors(rows, cols, cr, cc):
-                    if mine_mask[nr, nc] and not visited[nr, nc]:
-                        visited[nr, nc] = True
-                        stack.append((nr, nc))
+    for idx, is_mine in enumerate(flat):
+        if not is_mine or visited[idx]:
+            continue
+        clusters += 1
+        stack = [idx]
+        visited[idx] = 1
+
+        while stack:
+            cur = stack.pop()
+            for nidx in indices[offsets[cur]:offsets[cur + 1]]:
+                if flat[nidx] and not visited[nidx]:
+                    visited[nidx] = 1
+                    stack.append(nidx)
 
     return clusters
 
 
-def mines_in_local_region(mine_mask: np.ndarray) -> np.ndarray:
+def box_sum(values: np.ndarray, radius: int = 1) -> np.ndarray:
+    """Sum of every (2r+1)x(2r+1) window, clipped at the edges, over the last two axes.
+
+    Built from a summed-area table, so the cost does not depend on `radius`.
+    """
+    if radius < 0:
+        raise ValueError("radius must be zero or positive")
+    values = np.asarray(values)
+    rows, cols = values.shape[-2:]
+    acc_dtype = np.float64 if np.issubdtype(values.dtype, np.floating) else np.int64
+    table = np.zeros(values.shape[:-2] + (rows + 1, cols + 1), dtype=acc_dtype)
+    table[..., 1:, 1:] = values.cumsum(axis=-2, dtype=acc_dtype).cumsum(axis=-1)
+
+    top = np.clip(np.arange(rows) - radius, 0, rows)
+    bottom = np.clip(np.arange(rows) + radius + 1, 0, rows)
+    left = np.clip(np.arange(cols) - radius, 0, cols)
+    right = np.clip(np.arange(cols) + radius + 1, 0, cols)
+    return (
+        table[..., bottom[:, None], right[None, :]]
+        - table[..., top[:, None], right[None, :]]
+        - table[..., bottom[:, None], left[None, :]]
+        + table[..., top[:, None], left[None, :]]
+    )
+
+
+def mines_in_local_region(mine_mask: np.ndarray, radius: int = 1) -> np.ndarray:
+    """Mines in the (2r+1)x(2r+1) window around each cell, the cell included."""
+    heat = box_sum(mine_mask.astype(np.int64), radius)
+    return heat.astype(np.int8 if (2 * radius + 1) ** 2 <= 127 else np.int32)
+
+
+def mines_in_local_region_reference(mine_mask: np.ndarray, radius: int = 1) -> np.ndarray:
+    """Cell-by-cell version of mines_in_local_region, kept for parity checks."""
     rows, cols = mine_mask.shape
-    heat = np.zeros((rows, cols), dtype=np.int8)
+    flat = mine_mask.ravel().tolist()
+    heat = np.zeros(rows * cols, dtype=np.int8 if (2 * radius + 1) ** 2 <= 127 else np.int32)
     for r in range(rows):
         for c in range(cols):
-            count = int(mine_mask[r, c])
-            for nr, nc in neighbors(rows, cols, r, c):
-                if mine_mask[nr, nc]:
-                    count += 1
-            heat[r, c] = count
-    return heat
+            count = 0
+            for nr in range(max(0, r - radius), min(rows, r + radius + 1)):
+                base = nr * cols
+                count += sum(flat[base + max(0, c - radius):base + min(cols, c + radius + 1)])
+            heat[r * cols + c] = count
+    return heat.reshape(rows, cols)
 
 
 def generate_board(rows: int, cols: int, mines: int, rng: np.random.Generator):
@@ -72,31 +282,325 @@ def generate_board(rows: int, cols: int, mines: int, rng: np.random.Generator):
     return mine_mask, numbers
 
 
-def generate_report(rows: int, cols: int, mines: int, boards: int, output_path: str, seed: int | None = 42):
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    rng = np.random.default_rng(seed)
-    white_cells_per_board = []
-    clusters_per_board = []
+def generate_boards(rows: int, cols: int, mines: int, count: int, rng: np.random.Generator, first_click=None):
+    """Generate `count` boards at once as a (count, rows, cols) mask tensor.
+
+    Each board takes the `mines` cells with the smallest of rows*cols random
+    keys, so boards are drawn from `rng` one after another and splitting a run
+    into batches of any size yields the same boards.
+
+    `first_click=(row, col)` keeps that cell free of mines, as
+    `GameCore.place_mines` does with `safe_first`.
+    """
+    if mines < 0 or mines >= rows * cols:
+        raise ValueError("mines must be in [0, rows*cols-1]")
+    mine_masks = np.zeros((count, rows * cols), dtype=bool)
+    keys = rng.random((count, rows * cols))
+    if first_click is not None:
+        fr, fc = first_click
+        if not (0 <= fr < rows and 0 <= fc < cols):
+            raise ValueError("first_click must be on the board")
+        # Keys are below 1, so this cell is never among the smallest.
+        keys[:, fr * cols + fc] = 2.0
+    if mines:
+        chosen = np.argpartition(keys, mines - 1, axis=1)[:, :mines]
+        np.put_along_axis(mine_masks, chosen, True, axis=1)
+    mine_masks = mine_masks.reshape(count, rows, cols)
+
+    numbers = count_neighbor_mines(mine_masks)
+    return mine_masks, numbers
+
+
+def plot_histogram(ax, histogram: FixedHistogram, color: str):
+    """Draw the occupied bins of a fixed-bin histogram as bars."""
+    first, last = histogram.occupied_range()
+    xs = np.arange(first, last + 1)
+    ax.bar(xs, histogram.counts[first:last + 1], width=1.0, color=color, edgecolor="black")
+
+
+# Most board cells generated and analysed in one batch, so a worker's peak
+# memory (about 200 MB) does not grow with the board size.
+BATCH_CELLS = 1 << 20
+
+
+def compute_partial_stats(
+    rows: int,
+    cols: int,
+    mines: int,
+    boards: int,
+    seed_seq,
+    batch_size: int = 1024,
+    first_click=None,
+    on_batch=None,
+    cancelled=None,
+):
+    """Statistics for `boards` boards drawn from one seed stream; runs in a worker.
+
+    `on_batch(count)` is called after each batch and `cancelled()` checked
+    before it; both must be picklable when this runs in another process.
+    """
+    rng = np.random.default_rng(seed_seq)
+    # Per-board values go straight into fixed-size accumulators, so memory
+    # does not grow with `boards`.
+    white_cells = FixedHistogram(rows * cols + 1)
+    white_cells_summary = RunningStats()
+    clusters = FixedHistogram(mines + 1)
+    clusters_summary = RunningStats()
+    cluster_sizes = np.zeros(rows * cols + 1, dtype=np.int64)
+    bbbv = FixedHistogram(rows * cols + 1)
+    bbbv_summary = RunningStats()
+    openings = FixedHistogram(rows * cols + 1)
+    openings_summary = RunningStats()
+    opening_sizes = np.zeros(rows * cols + 1, dtype=np.int64)
+    first_click_openings = 0
     value_counts = np.zeros(9, dtype=np.int64)
-    heat_accum = np.zeros((rows, cols), dtype=np.float64)
+    mine_frequency = np.zeros((rows, cols), dtype=np.int64)
+
+    # batch_size caps the (batch, rows, cols) tensors held at once, and
+    # BATCH_CELLS keeps large boards from scaling that up with the board.
+    batch_size = max(1, min(batch_size, BATCH_CELLS // (rows * cols)))
+    for start in range(0, boards, batch_size):
+        if cancelled is not None and cancelled():
+            raise ReportCancelled()
+        count = min(batch_size, boards - start)
+        mine_masks, numbers = generate_boards(rows, cols, mines, count, rng, first_click)
+        safe = ~mine_masks
+        whites = safe & (numbers == 0)
+        white_counts = whites.sum(axis=(1, 2))
+        white_cells.update(white_counts)
+        white_cells_summary.update(white_counts)
+        value_counts += np.bincount(numbers[safe], minlength=9)
+        cluster_counts, sizes = mine_cluster_stats(mine_masks)
+        clusters.update(cluster_counts)
+        clusters_summary.update(cluster_counts)
+        cluster_sizes += np.bincount(sizes, minlength=rows * cols + 1)
+        board_bbbv, board_openings, sizes = opening_stats(mine_masks, numbers)
+        bbbv.update(board_bbbv)
+        bbbv_summary.update(board_bbbv)
+        openings.update(board_openings)
+        openings_summary.update(board_openings)
+        opening_sizes += np.bincount(sizes, minlength=rows * cols + 1)
+        if first_click is not None:
+            first_click_openings += int(whites[:, first_click[0], first_click[1]].sum())
+        mine_frequency += mine_masks.sum(axis=0)
+        if on_batch is not None:
+            on_batch(count)
+
+    stats = {
+        "white_cells": white_cells,
+        "white_cells_summary": white_cells_summary,
+        "clusters": clusters,
+        "clusters_summary": clusters_summary,
+        "cluster_sizes": cluster_sizes,
+        "bbbv": bbbv,
+        "bbbv_summary": bbbv_summary,
+        "openings": openings,
+        "openings_summary": openings_summary,
+        "opening_sizes": opening_sizes,
+        "value_counts": value_counts,
+        "mine_frequency": mine_frequency,
+    }
+    if first_click is not None:
+        # Boards on which the safe first click lands on a zero and opens an area.
+        stats["first_click_openings"] = first_click_openings
+    return stats
+
+
+def merge_partial_stats(partials):
+    """Combine worker results in worker order."""
+    first, rest = partials[0], partials[1:]
+    merged = {}
+    for key, value in first.items():
+        if key in ACCUMULATORS:
+            for partial in rest:
+                value.merge(partial[key])
+            merged[key] = value
+        else:
+            merged[key] = sum(p[key] for p in partials)
+    return merged
+
+
+# Bump when a change to the computation alters the numbers it produces, so
+# cached results from older code are not reused.
+STATS_VERSION = 2
+
+# Accumulator objects in a stats dict, by the class that restores them.
+ACCUMULATORS = {
+    "white_cells": FixedHistogram,
+    "white_cells_summary": RunningStats,
+    "clusters": FixedHistogram,
+    "clusters_summary": RunningStats,
+    "bbbv": FixedHistogram,
+    "bbbv_summary": RunningStats,
+    "openings": FixedHistogram,
+    "openings_summary": RunningStats,
+}
+
+
+def stats_to_arrays(stats):
+    """Flatten a stats dict into named arrays for `np.savez`."""
+    return {key: value.to_array() if key in ACCUMULATORS else np.asarray(value) for key, value in stats.items()}
+
+
+def stats_from_arrays(arrays):
+    """Inverse of `stats_to_arrays`; accepts a dict or an open `.npz` file."""
+    stats = {}
+    for key in arrays:
+        value = arrays[key]
+        if key in ACCUMULATORS:
+            stats[key] = ACCUMULATORS[key].from_array(value)
+        elif value.ndim == 0:
+            stats[key] = value.item()
+        else:
+            stats[key] = value
+    return stats
+
+
+def report_key(rows: int, cols: int, mines: int, boards: int, seed: int | None, workers: int, first_click=None):
+    """Everything the computed numbers depend on.
+
+    batch_size is left out: batches consume the random stream in the same
+    order whatever their size, so it does not change the result.
+    """
+    first_click = tuple(first_click) if first_click is not None else None
+    return (STATS_VERSION, rows, cols, mines, boards, seed, workers, first_click)
 
-    for _ in range(boards):
-        mines_mask, numbers = generate_board(rows, cols, mines, rng)
-        whites = (~mines_mask) & (numbers == 0)
-        white_cells_per_board.append(int(whites.sum()))
-        non_mine_vals = numbers[~mines_mask].ravel()
-        value_counts += np.bincount(non_mine_vals, minlength=9)
-        num_clusters = count_mine_clusters(mines_mask)
-        clusters_per_board.append(num_clusters)
-        heat_accum += mines_in_local_region(mines_mask)
 
-    heat_avg = heat_accum / float(boards)
+def compute_report_stats(
+    rows: int,
+    cols: int,
+    mines: int,
+    boards: int,
+    seed: int | None = 42,
+    batch_size: int = 1024,
+    workers: int = 1,
+    cache=None,
+    progress=None,
+    cancel=None,
+    first_click=None,
+):
+    """Simulate `boards` boards and return the merged stats dict.
 
-    sns.set(style="whitegrid")
-    fig = plt.figure(figsize=(12, 9))
-    axes = fig.subplots(2, 2)
+    With a `ReportCache`, a seeded configuration computed before is loaded
+    from disk instead. `progress(done, total)` is called in the calling
+    thread as batches finish, and setting the `cancel` event (anything with
+    `is_set()`) stops the run with `ReportCancelled`. `first_click=(row,
+    col)` keeps that cell mine-free on every board, like a safe first click.
 
-    axes[0, 0].hist(white_cells_per_board, bins="auto", color="#4C78A8", edgecolor="black")
+    With a uniformly random first click, safe-first placement still gives
+    every mine layout the same probability, so the default (no fixed cell)
+    already matches boards from `GameCore.place_mines`.
+    """
+    if boards <= 0:
+        raise ValueError("boards must be positive")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if mines < 0 or mines >= rows * cols:
+        raise ValueError("mines must be in [0, rows*cols-1]")
+
+    # An unseeded run is different every time, so there is nothing to reuse.
+    key = report_key(rows, cols, mines, boards, seed, workers, first_click) if seed is not None else None
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            if progress is not None:
+                progress(boards, boards)
+            return stats_from_arrays(cached)
+
+    # One child stream per worker share: the result depends only on seed and
+    # worker count, never on scheduling.
+    children = np.random.SeedSequence(seed).spawn(workers)
+    shares = [boards // workers + (i < boards % workers) for i in range(workers)]
+    jobs = [(rows, cols, mines, share, child, batch_size, first_click) for share, child in zip(shares, children)]
+    if workers == 1:
+        done = 0
+
+        def on_batch(count):
+            nonlocal done
+            done += count
+            progress(done, boards)
+
+        cancelled = cancel.is_set if cancel is not None else None
+        partials = [compute_partial_stats(*jobs[0], on_batch if progress is not None else None, cancelled)]
+    else:
+        partials = run_partial_jobs(jobs, boards, progress, cancel)
+
+    stats = {"rows": rows, "cols": cols, "mines": mines, "boards": boards, **merge_partial_stats(partials)}
+    if first_click is not None:
+        stats["first_click"] = np.array(first_click)
+    if cache is not None and key is not None:
+        cache.put(key, stats_to_arrays(stats))
+    return stats
+
+
+def run_partial_jobs(jobs, boards, progress=None, cancel=None):
+    """Run compute_partial_stats jobs on a process pool, in job order."""
+    if progress is None and cancel is None:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            return list(pool.map(compute_partial_stats, *zip(*jobs)))
+
+    # Workers report batches through a manager queue and poll a manager
+    # event; this thread relays both while it waits for the results.
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        batches = manager.Queue()
+        stop = manager.Event()
+        futures = [pool.submit(compute_partial_stats, *job, batches.put, stop.is_set) for job in jobs]
+        done = 0
+        pending = set(futures)
+        while pending:
+            finished, pending = wait(pending, timeout=0.1, return_when=FIRST_EXCEPTION)
+            if any(future.exception() for future in finished):
+                stop.set()
+                break
+            if cancel is not None and cancel.is_set():
+                stop.set()
+            reported = done
+            while True:
+                try:
+                    done += batches.get_nowait()
+                except queue.Empty:
+                    break
+            if progress is not None and done != reported:
+                progress(done, boards)
+        wait(futures)
+        # Once one worker fails the others stop with ReportCancelled; report
+        # the original failure rather than the knock-on cancellations.
+        errors = [future.exception() for future in futures if future.exception()]
+        errors.sort(key=lambda exc: isinstance(exc, ReportCancelled))
+        if errors:
+            raise errors[0]
+        return [future.result() for future in futures]
+
+
+def render_report(stats, output_path: str, style: str = "whitegrid", heat_radius: int = 1):
+    """Draw a stats dict from `compute_report_stats` to `output_path`."""
+    # The plotting stack is slow to import, and workers that only compute
+    # stats never need it.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    boards = stats["boards"]
+    white_cells = stats["white_cells"]
+    clusters = stats["clusters"]
+    cluster_sizes = stats["cluster_sizes"]
+    value_counts = stats["value_counts"]
+    mine_frequency = stats["mine_frequency"]
+
+    # The window sum is linear, so filtering the summed mine map once equals
+    # averaging the per-board heat maps.
+    heat_avg = box_sum(mine_frequency, heat_radius) / float(boards)
+    window = f"{2 * heat_radius + 1}x{2 * heat_radius + 1}"
+
+    sns.set(style=style)
+    fig = plt.figure(figsize=(12, 22))
+    axes = fig.subplots(5, 2, gridspec_kw={"height_ratios": [1, 1, 1, 1, 0.6]})
+
+    plot_histogram(axes[0, 0], white_cells, "#4C78A8")
     axes[0, 0].set_title("Histogram of White Cells per Board")
     axes[0, 0].set_xlabel("White cells (value 0, non-mine)")
     axes[0, 0].set_ylabel("Count of boards")
@@ -108,7 +612,7 @@ def generate_report(rows: int, cols: int, mines: int, boards: int, output_path:
     axes[0, 1].set_xticks(xs)
     axes[0, 1].set_ylabel("Cell count")
 
-    axes[1, 0].hist(clusters_per_board, bins="auto", color="#54A24B", edgecolor="black")
+    plot_histogram(axes[1, 0], clusters, "#54A24B")
     axes[1, 0].set_title("Number of Mine Clusters per Board (8-connected)")
     axes[1, 0].set_xlabel("Clusters per board")
     axes[1, 0].set_ylabel("Count of boards")
@@ -118,12 +622,76 @@ def generate_report(rows: int, cols: int, mines: int, boards: int, output_path:
         ax=axes[1, 1],
         cmap="magma",
         square=True,
-        cbar_kws={"label": "Avg mines in 3x3 region"},
+        cbar_kws={"label": f"Avg mines in {window} region"},
     )
-    axes[1, 1].set_title("Average Mines in 3x3 Region (across boards)")
+    axes[1, 1].set_title(f"Average Mines in {window} Region (across boards)")
     axes[1, 1].set_xlabel("Column")
     axes[1, 1].set_ylabel("Row")
 
+    plot_histogram(axes[2, 0], FixedHistogram.from_array(cluster_sizes), "#B279A2")
+    axes[2, 0].set_title("Mine Cluster Size Distribution (8-connected)")
+    axes[2, 0].set_xlabel("Mines in cluster")
+    axes[2, 0].set_ylabel("Count of clusters")
+
+    plot_histogram(axes[2, 1], stats["bbbv"], "#E45756")
+    axes[2, 1].set_title("3BV per Board (minimum clicks to clear)")
+    axes[2, 1].set_xlabel("3BV")
+    axes[2, 1].set_ylabel("Count of boards")
+
+    plot_histogram(axes[3, 0], stats["openings"], "#72B7B2")
+    axes[3, 0].set_title("Openings per Board")
+    axes[3, 0].set_xlabel("Openings per board")
+    axes[3, 0].set_ylabel("Count of boards")
+
+    plot_histogram(axes[3, 1], FixedHistogram.from_array(stats["opening_sizes"]), "#9D755D")
+    axes[3, 1].set_title("Opening Size Distribution (zeros plus border)")
+    axes[3, 1].set_xlabel("Cells revealed by the opening")
+    axes[3, 1].set_ylabel("Count of openings")
+
+    blocks = []
+    for label, key in (
+        ("White cells", "white_cells_summary"),
+        ("Mine clusters", "clusters_summary"),
+        ("3BV", "bbbv_summary"),
+        ("Openings", "openings_summary"),
+    ):
+        summary = stats[key]
+        low, high = summary.confidence_interval()
+        blocks.append(
+            f"{label} per board\n"
+            f"  mean {summary.mean:.3f} (95% CI {low:.3f} to {high:.3f})\n"
+            f"  std {summary.std:.3f}, min {summary.min:g}, max {summary.max:g}"
+        )
+    header = f"{boards} boards"
+    if "first_click" in stats:
+        fr, fc = (int(v) for v in stats["first_click"])
+        header += f", first click ({fr}, {fc}) kept safe, opens an area on {stats['first_click_openings'] / boards:.1%}"
+    for ax in axes[4]:
+        ax.axis("off")
+    axes[4, 0].text(0.0, 1.0, header + "\n\n" + "\n\n".join(blocks[:2]), va="top", family="monospace")
+    axes[4, 1].text(0.0, 1.0, "\n\n" + "\n\n".join(blocks[2:]), va="top", family="monospace")
+
     fig.tight_layout()
     fig.savefig(output_path)
     plt.close(fig)
+
+
+def generate_report(
+    rows: int,
+    cols: int,
+    mines: int,
+    boards: int,
+    output_path: str,
+    seed: int | None = 42,
+    batch_size: int = 1024,
+    heat_radius: int = 1,
+    workers: int = 1,
+    cache=None,
+    style: str = "whitegrid",
+    progress=None,
+    cancel=None,
+    first_click=None,
+):
+    stats = compute_report_stats(rows, cols, mines, boards, seed, batch_size, workers, cache, progress, cancel, first_click)
+    render_report(stats, output_path, style, heat_radius)
+    return stats
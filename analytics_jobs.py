@@ -0,0 +1,120 @@
+"""Background queue for analytics report jobs.
+
+Jobs run one at a time on a daemon thread. The thread never touches Tk:
+progress and results are posted to `events`, which the GUI drains from
+`root.after` on the main thread.
+"""
+
+import queue
+import threading
+from collections import deque
+
+
+class AnalyticsJob:
+    def __init__(self, rows: int, cols: int, mines: int, boards: int, workers: int, pdf_path: str, created_at: str):
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.boards = boards
+        self.workers = workers
+        self.pdf_path = pdf_path
+        self.created_at = created_at
+        self.cancel_event = threading.Event()
+
+    def record(self):
+        return {
+            "created_at": self.created_at,
+            "boards": self.boards,
+            "rows": self.rows,
+            "cols": self.cols,
+            "mines": self.mines,
+            "pdf_path": self.pdf_path,
+        }
+
+
+class AnalyticsWorker:
+    """Runs `run(job, progress)` for each submitted job on one thread.
+
+    Events are (kind, job, payload) tuples: ("progress", job, (done, total)),
+    ("done", job, None), ("cancelled", job, None) or ("failed", job, exc).
+    """
+
+    def __init__(self, run):
+        self.run = run
+        # Waiting jobs and the running one change together under `lock`, so
+        # cancel() cannot miss a job that is being picked up.
+        self.lock = threading.Condition()
+        self.waiting = deque()
+        self.current = None
+        self.events = queue.Queue()
+        self.thread = None
+        self.closed = False
+
+    def submit(self, job: AnalyticsJob):
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("analytics worker is shut down")
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.work, name="analytics-worker", daemon=True)
+                self.thread.start()
+            self.waiting.append(job)
+            self.lock.notify()
+
+    def pending(self):
+        with self.lock:
+            return len(self.waiting) + (self.current is not None)
+
+    def cancel(self):
+        """Cancel the running job and drop the ones still waiting."""
+        with self.lock:
+            self.cancel_locked()
+
+    def cancel_locked(self):
+        # Callers hold `lock`.
+        for job in self.waiting:
+            job.cancel_event.set()
+            self.events.put(("cancelled", job, None))
+        self.waiting.clear()
+        if self.current is not None:
+            self.current.cancel_event.set()
+
+    def shutdown(self, timeout: float = 5.0):
+        """Cancel everything, stop taking jobs and wait up to `timeout` for the thread.
+
+        A running job's process pool is only torn down once the job returns,
+        and interpreter exit waits for that pool, so call this before exiting.
+        """
+        with self.lock:
+            self.closed = True
+            self.cancel_locked()
+            self.lock.notify()
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def work(self):
+        while True:
+            with self.lock:
+                while not self.waiting and not self.closed:
+                    self.lock.wait()
+                if self.closed:
+                    return
+                job = self.current = self.waiting.popleft()
+            try:
+                self.run(job, lambda done, total: self.events.put(("progress", job, (done, total))))
+            except Exception as exc:
+                kind = "cancelled" if job.cancel_event.is_set() else "failed"
+                self.events.put((kind, job, exc if kind == "failed" else None))
+            else:
+                self.events.put(("done", job, None))
+            finally:
+                with self.lock:
+                    self.current = None
+
+    def poll(self):
+        """Return the events posted since the last call."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
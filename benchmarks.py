@@ -0,0 +1,263 @@
+"""Micro-benchmarks for the game engine and analytics.
+
+Run `python benchmarks.py <name>` or `python benchmarks.py all`.
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import time
+
+from game_logic import DIFFICULTIES, GameCore, neighbor_table
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def bench_openings(rows=1000, cols=1000, density=0.01, clicks=50, seed=7):
+    """Flood fill vs precomputed opening index on a sparse board."""
+    mines = int(rows * cols * density)
+    neighbor_table(rows, cols)
+
+    results = {}
+    for label, use_openings in (("flood fill", False), ("opening index", True)):
+        game = GameCore(rows, cols, mines, openings=use_openings, seed=seed)
+        place_time, _ = timed(game.place_mines, first_click=(rows // 2, cols // 2))
+        click_rng = random.Random(seed)
+        reveal_time = 0.0
+        for _ in range(clicks):
+            r, c = click_rng.randrange(rows), click_rng.randrange(cols)
+            if game.mine[r * cols + c]:
+                continue
+            elapsed, _ = timed(game.large_area_reveal, r, c)
+            reveal_time += elapsed
+        results[label] = bytes(game.revealed)
+        print(
+            f"{label:>14}: place_mines {place_time * 1000:8.1f} ms, "
+            f"{clicks} clicks {reveal_time * 1000:8.1f} ms, revealed {game.revealed_count}"
+        )
+    assert results["flood fill"] == results["opening index"], "opening index diverged from flood fill"
+
+
+def bench_solver(positions=50, seed=11):
+    """Solve time on mid-game Expert positions reached by the solver policy."""
+    import solver
+    from simulator import solver_policy
+
+    rows, cols, mines = DIFFICULTIES["Expert"]
+    boards = []
+    rng = random.Random(seed)
+    while len(boards) < positions:
+        game = GameCore(rows, cols, mines, seed=rng.getrandbits(63))
+        stop_at = rng.randint(20, 60)
+        for _ in range(stop_at):
+            r, c, _ = solver_policy(game, rng)
+            if not game.reveal(r, c) or game.check_win():
+                break
+        if not game.is_game_over:
+            boards.append(game)
+
+    solver.enumerate_component.cache_clear()
+    times = []
+    for game in boards:
+        elapsed, _ = timed(solver.solve, game)
+        times.append(elapsed)
+    times.sort()
+    print(
+        f"{len(times)} positions: median {times[len(times) // 2] * 1000:.2f} ms, "
+        f"p95 {times[int(len(times) * 0.95)] * 1000:.2f} ms, max {times[-1] * 1000:.2f} ms"
+    )
+
+
+def bench_neighbor_counts(sizes=((9, 9), (16, 30), (100, 100), (300, 300)), density=0.2, repeats=5, seed=3):
+    """Vectorised analytics.count_neighbor_mines vs the per-cell reference."""
+    import numpy as np
+
+    import analytics
+
+    rng = np.random.default_rng(seed)
+    for rows, cols in sizes:
+        masks = [rng.random((rows, cols)) < density for _ in range(repeats)]
+        neighbor_table(rows, cols)
+        loop_time = fast_time = 0.0
+        for mask in masks:
+            elapsed, _ = timed(analytics.count_neighbor_mines_reference, mask)
+            loop_time += elapsed
+            elapsed, _ = timed(analytics.count_neighbor_mines, mask)
+            fast_time += elapsed
+        print(
+            f"{rows:>4}x{cols:<4}: loop {loop_time / repeats * 1000:8.3f} ms, "
+            f"vectorised {fast_time / repeats * 1000:7.3f} ms, speedup {loop_time / fast_time:6.1f}x"
+        )
+
+
+def bench_clusters(sizes=((9, 9), (16, 30), (100, 100)), densities=(0.0, 0.1, 0.2, 0.4, 0.6, 0.8, 1.0), batch=64, seed=13):
+    """Batched union-find cluster counts vs the depth-first reference."""
+    import numpy as np
+
+    import analytics
+
+    rng = np.random.default_rng(seed)
+    for rows, cols in sizes:
+        neighbor_table(rows, cols)
+        loop_time = fast_time = 0.0
+        for density in densities:
+            masks = rng.random((batch, rows, cols)) < density
+            elapsed, _ = timed(lambda: [analytics.count_mine_clusters_reference(mask) for mask in masks])
+            loop_time += elapsed
+            elapsed, _ = timed(analytics.mine_cluster_stats, masks)
+            fast_time += elapsed
+        boards = batch * len(densities)
+        print(
+            f"{rows:>4}x{cols:<4}: loop {loop_time / boards * 1000:8.3f} ms/board, "
+            f"batched {fast_time / boards * 1000:7.3f} ms/board, speedup {loop_time / fast_time:6.1f}x"
+        )
+
+
+def bench_heatmap(sizes=((9, 9), (16, 30), (100, 100)), radii=(0, 1, 2, 3), density=0.2, batch=16, seed=17):
+    """Batched summed-area box filter vs the per-cell window reference."""
+    import numpy as np
+
+    import analytics
+
+    rng = np.random.default_rng(seed)
+    for rows, cols in sizes:
+        masks = rng.random((batch, rows, cols)) < density
+        for radius in radii:
+            loop_time, _ = timed(lambda: [analytics.mines_in_local_region_reference(m, radius) for m in masks])
+            fast_time, _ = timed(analytics.mines_in_local_region, masks, radius)
+            print(
+                f"{rows:>4}x{cols:<4} r={radius}: loop {loop_time / batch * 1000:8.3f} ms/board, "
+                f"box filter {fast_time / batch * 1000:7.3f} ms/board, speedup {loop_time / fast_time:6.1f}x"
+            )
+
+
+STARTUP_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+import tkinter as tk
+import gui
+imported = time.perf_counter()
+root = tk.Tk()
+gui.Minesweeper(root, rows=16, cols=30, mines=99)
+root.update()
+ready = time.perf_counter()
+heavy = [name for name in ("numpy", "matplotlib", "seaborn") if name in sys.modules]
+print(imported - started, ready - started, ",".join(heavy))
+root.destroy()
+"""
+
+
+def bench_startup(runs=5):
+    """Time to first interactive board, each run in a fresh interpreter."""
+    imports, totals = [], []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"skipped: {result.stderr.strip().splitlines()[-1]}")
+            return
+        import_time, total_time, heavy = result.stdout.split(" ")
+        imports.append(float(import_time))
+        totals.append(float(total_time))
+    imports.sort()
+    totals.sort()
+    print(
+        f"{runs} runs: imports median {imports[runs // 2] * 1000:.1f} ms, "
+        f"first board median {totals[runs // 2] * 1000:.1f} ms, max {totals[-1] * 1000:.1f} ms, "
+        f"heavy modules loaded: {heavy.strip() or 'none'}"
+    )
+
+
+def bench_board_views(sizes=((16, 30), (50, 50), (100, 100), (1000, 1000)), clicks=50, seed=5, max_buttons=20_000):
+    """Board build and per-click redraw time, Button grid vs Canvas.
+
+    Boards above `max_buttons` cells only run the (virtualised) canvas.
+    """
+    import tkinter as tk
+
+    import gui
+    from board_view import BOARD_VIEWS
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        print(f"skipped: {exc}")
+        return
+    root.withdraw()
+    try:
+        for rows, cols in sizes:
+            mines = rows * cols // 5
+            for name in sorted(BOARD_VIEWS):
+                if name == "buttons" and rows * cols > max_buttons:
+                    continue
+                window = tk.Toplevel(root)
+                build_time, app = timed(
+                    lambda: gui.Minesweeper(window, rows=rows, cols=cols, mines=mines, renderer=name)
+                )
+                root.update()
+                # Resets reuse the widgets/items of the same shape.
+                reset_time, _ = timed(lambda: (app.create_board(), root.update()))
+
+                game = app.game
+                game.rng.seed(seed)
+                game.place_mines(first_click=(rows // 2, cols // 2))
+                click_rng = random.Random(seed)
+                safe = [idx for idx in range(rows * cols) if not game.mine[idx]]
+                redraw_time = 0.0
+                done = 0
+                while done < clicks and game.hidden_safe > 1:
+                    r, c = divmod(click_rng.choice(safe), cols)
+                    if game.revealed[r * cols + c]:
+                        continue
+                    # Skip game_over(): it opens a modal dialog.
+                    elapsed, _ = timed(lambda: (game.reveal(r, c), app.refresh_ui(game.changes), root.update_idletasks()))
+                    redraw_time += elapsed
+                    done += 1
+
+                def sweep():
+                    # Pointer events arrive faster than frames; they only
+                    # move the hover pointer until the idle flush.
+                    for i in range(1000):
+                        r, c = divmod(i * 7 % (rows * cols), cols)
+                        app.hover(r, c, True)
+                        app.hover(r, c, False)
+                    root.update_idletasks()
+
+                sweep_time, _ = timed(sweep)
+                window.destroy()
+                print(
+                    f"{rows:>4}x{cols:<4} {name:>8}: build {build_time * 1000:8.1f} ms, reset {reset_time * 1000:8.1f} ms, "
+                    f"click+redraw {redraw_time / max(1, done) * 1000:7.2f} ms, "
+                    f"1000-cell hover sweep {sweep_time * 1000:7.1f} ms"
+                )
+    finally:
+        root.destroy()
+
+
+BENCHMARKS = {
+    "board_views": bench_board_views,
+    "clusters": bench_clusters,
+    "heatmap": bench_heatmap,
+    "neighbor_counts": bench_neighbor_counts,
+    "openings": bench_openings,
+    "solver": bench_solver,
+    "startup": bench_startup,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("name", choices=sorted(BENCHMARKS) + ["all"])
+    args = parser.parse_args()
+    names = sorted(BENCHMARKS) if args.name == "all" else [args.name]
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
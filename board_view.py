@@ -0,0 +1,406 @@
+"""Board renderers for the Tk GUI.
+
+Both views draw the cells handed to `paint` and report input back to the
+owning `Minesweeper` through `handle_left_click`, `toggle_flag`,
+`chord_cell` and `hover`. `ButtonBoard` is the original grid of one
+`tk.Button` per cell; `CanvasBoard` draws the visible cells on one
+`tk.Canvas`, scrolls and zooms, and finds the clicked cell by
+hit-testing, so a board costs a handful of bindings instead of six per
+cell.
+"""
+
+import sys
+import tkinter as tk
+import tkinter.font as tkfont
+
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+
+
+def cell_font_size(cell_px: int) -> int:
+    return max(8, int(cell_px * 0.45))
+
+
+class ButtonBoard:
+    def __init__(self, parent, app):
+        self.parent = parent
+        self.app = app
+        self.buttons = {}
+        # Last look given to each button, so repeated paints skip Tk.
+        self.styles = {}
+        self.rows = self.cols = 0
+        self.cell_px = 0
+        self.font = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+
+    def build(self, rows: int, cols: int, cell_px: int):
+        """Lay out a rows x cols grid, keeping the buttons already in it.
+
+        Buttons inside the new shape are reset to the hidden look; only the
+        rows and columns that were added or removed are created or destroyed.
+        """
+        old_rows, old_cols = self.rows, self.cols
+        self.rows, self.cols = rows, cols
+        try:
+            self.parent.config(width=cell_px * cols, height=cell_px * rows)
+            self.parent.grid_propagate(False)
+        except Exception:
+            pass
+        if cell_px != self.cell_px:
+            self.cell_px = cell_px
+            self.font.configure(size=cell_font_size(cell_px))
+            for r in range(min(rows, old_rows)):
+                self.parent.grid_rowconfigure(r, minsize=cell_px)
+            for c in range(min(cols, old_cols)):
+                self.parent.grid_columnconfigure(c, minsize=cell_px)
+
+        for (r, c) in [cell for cell in self.buttons if cell[0] >= rows or cell[1] >= cols]:
+            self.buttons.pop((r, c)).destroy()
+            self.styles.pop((r, c), None)
+        for r in range(rows, old_rows):
+            self.parent.grid_rowconfigure(r, weight=0, uniform="", minsize=0)
+        for c in range(cols, old_cols):
+            self.parent.grid_columnconfigure(c, weight=0, uniform="", minsize=0)
+        for r in range(old_rows, rows):
+            self.parent.grid_rowconfigure(r, weight=1, uniform="row", minsize=cell_px)
+        for c in range(old_cols, cols):
+            self.parent.grid_columnconfigure(c, weight=1, uniform="col", minsize=cell_px)
+
+        hidden = ("", "#111827", self.app.CELL_BG, False)
+        for r in range(rows):
+            for c in range(cols):
+                if (r, c) in self.buttons:
+                    self.paint(r, c, *hidden)
+                else:
+                    self.buttons[(r, c)] = self.create_button(r, c)
+
+    def create_button(self, r: int, c: int):
+        app = self.app
+        b = tk.Button(
+            self.parent,
+            text="",
+            bg=app.CELL_BG,
+            activebackground=app.CELL_BG_HOVER,
+            font=self.font,
+            relief=tk.RAISED,
+            command=lambda: app.handle_left_click(r, c),
+        )
+        b.bind("<Button-3>", lambda e: app.flag_cell_event(e, r, c))
+        if sys.platform == "darwin":
+            # Button-2 is the right button on macOS.
+            b.bind("<Button-2>", lambda e: app.flag_cell_event(e, r, c))
+        else:
+            b.bind("<Button-2>", lambda e: app.chord_cell_event(e, r, c))
+        b.bind("<Double-Button-1>", lambda e: self.on_double_press(e, r, c))
+        b.bind("<Control-Button-1>", lambda e: app.flag_cell_event(e, r, c))
+        b.bind("<Shift-Button-1>", lambda e: app.flag_cell_event(e, r, c))
+
+        b.bind("<Enter>", lambda e: app.hover(r, c, True))
+        b.bind("<Leave>", lambda e: app.hover(r, c, False))
+        b.grid(row=r, column=c, sticky="nsew")
+        self.styles[(r, c)] = ("", "#111827", app.CELL_BG, False)
+        return b
+
+    def on_double_press(self, event, r: int, c: int):
+        # The second press of a quick double click lands here instead of the
+        # single-press bindings; only a plain double click chords.
+        app = self.app
+        if event.state & (SHIFT_MASK | CONTROL_MASK):
+            return app.flag_cell_event(event, r, c)
+        if app.flag_mode_active:
+            app.handle_left_click(r, c)
+            return "break"
+        return app.chord_cell_event(event, r, c)
+
+    def shown_count(self):
+        return len(self.buttons)
+
+    def redraw(self):
+        style = self.app.cell_style
+        for (r, c) in self.buttons:
+            self.paint(r, c, *style(r, c))
+
+    def paint(self, r: int, c: int, text: str, fg: str, bg: str, sunken: bool):
+        style = (text, fg, bg, sunken)
+        if self.styles.get((r, c)) == style:
+            return
+        self.styles[(r, c)] = style
+        btn = self.buttons[(r, c)]
+        if sunken:
+            btn.config(text=text, bg=bg, state="disabled", relief=tk.SUNKEN, disabledforeground=fg)
+        else:
+            btn.config(text=text, fg=fg, bg=bg, state="normal", relief=tk.RAISED)
+
+    def destroy(self):
+        for b in self.buttons.values():
+            b.destroy()
+        self.buttons.clear()
+        self.styles.clear()
+        self.rows = self.cols = 0
+
+
+class CanvasBoard:
+    """Virtualised board on one Canvas.
+
+    Only cells inside the visible viewport have canvas items. Items of cells
+    that scroll out go to a free list and are reused for cells that scroll
+    in, so the item count tracks the window size, not the board size. Cell
+    looks come from `app.cell_style(r, c)` whenever a cell becomes visible;
+    `paint` on an off-screen cell is dropped.
+    """
+
+    OUTLINE = "#9CA3AF"
+    ZOOM_LEVELS = (8, 12, 16, 18, 24, 32, 40, 48, 64)
+    MIN_TEXT_PX = 12
+
+    def __init__(self, parent, app):
+        self.parent = parent
+        self.app = app
+        self.max_width = app.BOARD_MAX_WIDTH
+        self.max_height = app.BOARD_MAX_HEIGHT
+        self.rows = self.cols = 0
+        self.cell_px = 0
+        self.items = {}
+        self.free = []
+        # Look last given to each rectangle item (fill, text, text colour);
+        # it travels with the item through the free list.
+        self.styles = {}
+        self.visible = (0, 0, 0, 0)
+        self.viewport_job = None
+        self.hovered = None
+        self.font = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self.canvas = tk.Canvas(parent, bg=app.PANEL_BG, highlightthickness=0, bd=0)
+        self.xbar = tk.Scrollbar(parent, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.ybar = tk.Scrollbar(parent, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.config(xscrollcommand=self.on_xscroll, yscrollcommand=self.on_yscroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.bind_input()
+
+    def bind_input(self):
+        canvas = self.canvas
+        canvas.bind("<Button-1>", self.on_left_press)
+        canvas.bind("<Double-Button-1>", self.on_double_press)
+        canvas.bind("<Button-3>", lambda e: self.dispatch(e, self.app.toggle_flag))
+        if sys.platform == "darwin":
+            # Button-2 is the right button on macOS.
+            canvas.bind("<Button-2>", lambda e: self.dispatch(e, self.app.toggle_flag))
+        else:
+            canvas.bind("<Button-2>", lambda e: self.dispatch(e, self.app.chord_cell))
+        canvas.bind("<Motion>", self.on_motion)
+        canvas.bind("<Leave>", lambda e: self.set_hovered(None))
+        canvas.bind("<Configure>", lambda e: self.schedule_viewport())
+        # Wheel scrolls, Shift+wheel scrolls sideways, Ctrl+wheel zooms.
+        canvas.bind("<MouseWheel>", lambda e: self.on_wheel(e, -1 if e.delta > 0 else 1))
+        canvas.bind("<Button-4>", lambda e: self.on_wheel(e, -1))
+        canvas.bind("<Button-5>", lambda e: self.on_wheel(e, 1))
+
+    def build(self, rows: int, cols: int, cell_px: int):
+        """Lay out a rows x cols board, reusing the items already on the canvas.
+
+        At an unchanged cell size, items of cells still on the board keep
+        their place and are only repainted; the rest go through the viewport
+        update like a scroll.
+        """
+        self.parent.grid_propagate(True)
+        if cell_px != self.cell_px:
+            self.rows, self.cols = rows, cols
+            self.set_cell_px(cell_px)
+            return
+        if (rows, cols) != (self.rows, self.cols):
+            self.rows, self.cols = rows, cols
+            self.set_hovered(None)
+            self.configure_region()
+            self.update_viewport()
+        self.redraw()
+
+    def set_cell_px(self, cell_px: int, anchor=None):
+        """Lay the board out at `cell_px`, keeping the board point under the
+        canvas pixel `anchor` in place (the view's top-left by default)."""
+        canvas = self.canvas
+        old_px = self.cell_px or cell_px
+        ax, ay = anchor if anchor is not None else (0, 0)
+        board_x = (canvas.canvasx(ax)) / old_px
+        board_y = (canvas.canvasy(ay)) / old_px
+
+        self.release_all()
+        self.set_hovered(None)
+        self.cell_px = cell_px
+        self.font.configure(size=max(6, int(cell_px * 0.45)))
+        width, height = self.configure_region()
+        if width:
+            canvas.xview_moveto(max(0.0, (board_x * cell_px - ax) / width))
+        if height:
+            canvas.yview_moveto(max(0.0, (board_y * cell_px - ay) / height))
+        self.update_viewport()
+
+    def configure_region(self):
+        """Size the canvas and scroll region to the board; returns its pixel size."""
+        width, height = self.cols * self.cell_px, self.rows * self.cell_px
+        view_w, view_h = min(width, self.max_width), min(height, self.max_height)
+        self.canvas.config(width=view_w, height=view_h, scrollregion=(0, 0, width, height))
+        if width > view_w:
+            self.xbar.grid(row=1, column=0, sticky="ew")
+        else:
+            self.xbar.grid_remove()
+        if height > view_h:
+            self.ybar.grid(row=0, column=1, sticky="ns")
+        else:
+            self.ybar.grid_remove()
+        return width, height
+
+    def zoom(self, step: int, anchor=None):
+        levels = self.ZOOM_LEVELS
+        current = min(range(len(levels)), key=lambda i: abs(levels[i] - self.cell_px))
+        target = levels[max(0, min(len(levels) - 1, current + step))]
+        if target != self.cell_px:
+            self.set_cell_px(target, anchor)
+
+    def on_wheel(self, event, direction: int):
+        if event.state & CONTROL_MASK:
+            self.zoom(-direction, (event.x, event.y))
+        elif event.state & SHIFT_MASK:
+            self.canvas.xview_scroll(direction * 3, "units")
+        else:
+            self.canvas.yview_scroll(direction * 3, "units")
+        return "break"
+
+    def on_xscroll(self, first, last):
+        self.xbar.set(first, last)
+        self.schedule_viewport()
+
+    def on_yscroll(self, first, last):
+        self.ybar.set(first, last)
+        self.schedule_viewport()
+
+    def schedule_viewport(self):
+        # Scroll events arrive in bursts; lay out once they have been handled.
+        if self.viewport_job is None:
+            self.viewport_job = self.canvas.after_idle(self.update_viewport)
+
+    def visible_range(self):
+        """(first_row, last_row, first_col, last_col), end-exclusive."""
+        px = self.cell_px
+        if px <= 0:
+            return (0, 0, 0, 0)
+        canvas = self.canvas
+        left, top = canvas.canvasx(0), canvas.canvasy(0)
+        right = left + max(canvas.winfo_width(), int(canvas.cget("width")))
+        bottom = top + max(canvas.winfo_height(), int(canvas.cget("height")))
+        return (
+            max(0, int(top) // px),
+            min(self.rows, int(bottom) // px + 1),
+            max(0, int(left) // px),
+            min(self.cols, int(right) // px + 1),
+        )
+
+    def update_viewport(self):
+        self.viewport_job = None
+        r0, r1, c0, c1 = self.visible = self.visible_range()
+        items = self.items
+        for cell in [cell for cell in items if not (r0 <= cell[0] < r1 and c0 <= cell[1] < c1)]:
+            self.release(cell)
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                if (r, c) not in items:
+                    self.place(r, c)
+
+    def place(self, r: int, c: int):
+        canvas, px = self.canvas, self.cell_px
+        x, y = c * px, r * px
+        if self.free:
+            rect, text = self.free.pop()
+            canvas.coords(rect, x, y, x + px, y + px)
+            canvas.coords(text, x + px / 2, y + px / 2)
+            canvas.itemconfigure(rect, state="normal")
+            canvas.itemconfigure(text, state="normal")
+        else:
+            rect = canvas.create_rectangle(x, y, x + px, y + px, outline=self.OUTLINE)
+            text = canvas.create_text(x + px / 2, y + px / 2, font=self.font)
+        self.items[(r, c)] = (rect, text)
+        self.paint(r, c, *self.app.cell_style(r, c))
+
+    def release(self, cell):
+        rect, text = self.items.pop(cell)
+        self.canvas.itemconfigure(rect, state="hidden")
+        self.canvas.itemconfigure(text, state="hidden")
+        self.free.append((rect, text))
+
+    def release_all(self):
+        for cell in list(self.items):
+            self.release(cell)
+
+    def cell_at(self, x: int, y: int):
+        """(row, col) under canvas pixel (x, y), or None off the board."""
+        if self.cell_px <= 0 or x < 0 or y < 0:
+            return None
+        r, c = int(y) // self.cell_px, int(x) // self.cell_px
+        if r >= self.rows or c >= self.cols:
+            return None
+        return r, c
+
+    def dispatch(self, event, handler):
+        cell = self.cell_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if cell is not None:
+            handler(*cell)
+        return "break"
+
+    def on_left_press(self, event):
+        if event.state & (SHIFT_MASK | CONTROL_MASK):
+            return self.dispatch(event, self.app.toggle_flag)
+        return self.dispatch(event, self.app.handle_left_click)
+
+    def on_double_press(self, event):
+        # The second press of a quick double click lands here instead of
+        # <Button-1>; only a plain double click outside flag mode chords.
+        if event.state & (SHIFT_MASK | CONTROL_MASK) or self.app.flag_mode_active:
+            return self.on_left_press(event)
+        return self.dispatch(event, self.app.chord_cell)
+
+    def on_motion(self, event):
+        self.set_hovered(self.cell_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)))
+
+    def set_hovered(self, cell):
+        if cell == self.hovered:
+            return
+        previous, self.hovered = self.hovered, cell
+        if previous is not None:
+            self.app.hover(*previous, False)
+        if cell is not None:
+            self.app.hover(*cell, True)
+
+    def shown_count(self):
+        return len(self.items)
+
+    def redraw(self):
+        style = self.app.cell_style
+        for (r, c) in self.items:
+            self.paint(r, c, *style(r, c))
+
+    def paint(self, r: int, c: int, text: str, fg: str, bg: str, sunken: bool):
+        pair = self.items.get((r, c))
+        if pair is None:
+            return
+        rect, label = pair
+        # Glyphs are unreadable below a minimum cell size; colour carries the state.
+        if self.cell_px < self.MIN_TEXT_PX:
+            text = ""
+        old = self.styles.get(rect)
+        if old == (bg, text, fg):
+            return
+        self.styles[rect] = (bg, text, fg)
+        if old is None or old[0] != bg:
+            self.canvas.itemconfigure(rect, fill=bg)
+        if old is None or old[1:] != (text, fg):
+            self.canvas.itemconfigure(label, text=text, fill=fg)
+
+    def destroy(self):
+        if self.viewport_job is not None:
+            self.canvas.after_cancel(self.viewport_job)
+        self.canvas.destroy()
+        self.xbar.destroy()
+        self.ybar.destroy()
+
+
+BOARD_VIEWS = {
+    "buttons": ButtonBoard,
+    "canvas": CanvasBoard,
+}
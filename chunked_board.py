@@ -0,0 +1,269 @@
+"""Lazily generated, chunked board engine for huge and infinite boards."""
+
+import math
+import random
+
+from game_logic import Cell, CellChange, FLAGGED, HIDDEN, REVEALED
+
+
+class Chunk:
+    """Planes for one chunk_size x chunk_size block, laid out like GameCore's."""
+
+    __slots__ = ("mine", "revealed", "flagged", "numbers")
+
+    def __init__(self, area):
+        self.mine = bytearray(area)
+        self.revealed = bytearray(area)
+        self.flagged = bytearray(area)
+        self.numbers = bytearray(area)
+
+
+class ChunkedGameCore:
+    """Board whose cells are only materialised when a chunk is first touched.
+
+    Bounded boards (`rows` and `cols` given) place exactly `mines` mines with a
+    sparse O(mines) sample. Leaving `rows`/`cols` as None gives an infinite
+    board where each chunk's mines are derived from the board's seed and the chunk
+    coordinates with the given `density`, so memory only grows with the
+    explored area.
+
+    On infinite boards a single flood fill stops after `reveal_limit` cells,
+    since a sparse board's zero region can be unbounded. The cut is published
+    as a "reveal_partial" operation, the unexplored frontier is kept in
+    `pending_fill`, and the next reveal (or `resume_reveal()`) continues it.
+    """
+
+    def __init__(self, rows=None, cols=None, mines=0, density=None, seed=None, chunk_size=32, reveal_limit=250_000):
+        self.infinite = rows is None or cols is None
+        if self.infinite:
+            if density is None or not 0 < density < 1:
+                raise ValueError("infinite boards need a density in (0, 1)")
+            mines = 0
+        elif mines < 0 or mines >= rows * cols:
+            raise ValueError("mines must be in [0, rows*cols-1]")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.density = density
+        # As in GameCore, every board draws its own board_seed from this
+        # stream, so a reset deals a new layout and a seeded core a
+        # reproducible sequence of them.
+        self.rng = random.Random(seed)
+        self.board_seed = None
+        self.chunk_size = chunk_size
+        # Cap on cells opened by a single flood fill on infinite boards.
+        self.reveal_limit = reveal_limit
+
+        self.changes = []
+        self.listeners = []
+        self.reset()
+
+    def reset(self):
+        self.is_game_over = False
+        self.mines_placed = False
+        self.board_seed = None
+        self.flags_left = self.mines
+        self.chunks = {}
+        self.chunk_mines = {}
+        self.safe_zone = frozenset()
+        self.pending_fill = []
+
+        self.revealed_count = 0
+        self.flags_placed = 0
+        self.hidden_safe = None if self.infinite else self.rows * self.cols - self.mines
+        self.publish("reset", [])
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def publish(self, operation, changes):
+        self.changes = changes
+        for callback in list(self.listeners):
+            callback(operation, changes)
+
+    def in_bounds(self, r, c):
+        return self.infinite or (0 <= r < self.rows and 0 <= c < self.cols)
+
+    def place_mines(self, first_click=None, safe_first=True, board_seed=None):
+        """Place mines from `board_seed`, or from the next seed of `self.rng`."""
+        if board_seed is None:
+            board_seed = self.rng.getrandbits(63)
+        self.board_seed = board_seed
+        cs = self.chunk_size
+        if self.infinite:
+            # Keep the first click and its neighbours clear so play opens up.
+            if safe_first and first_click:
+                fr, fc = first_click
+                self.safe_zone = frozenset((fr + dr, fc + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+        else:
+            skip = None
+            if safe_first and first_click and self.in_bounds(*first_click):
+                skip = first_click[0] * self.cols + first_click[1]
+            rng = random.Random(board_seed)
+            # sample() over a range draws without materialising the range.
+            picked = rng.sample(range(self.rows * self.cols), self.mines + (skip is not None))
+            if skip is not None:
+                if skip in picked:
+                    picked.remove(skip)
+                else:
+                    picked.pop()
+            for idx in picked:
+                r, c = divmod(idx, self.cols)
+                self.chunk_mines.setdefault((r // cs, c // cs), []).append((r % cs) * cs + c % cs)
+        self.mines_placed = True
+
+    def mines_in_chunk(self, key):
+        if not self.infinite:
+            return self.chunk_mines.get(key, ())
+        mines = self.chunk_mines.get(key)
+        if mines is None:
+            mines = self.chunk_mines[key] = self.generate_chunk_mines(key)
+        return mines
+
+    def generate_chunk_mines(self, key):
+        cr, cc = key
+        cs = self.chunk_size
+        area = cs * cs
+        rng = random.Random(f"{self.board_seed}:{cr}:{cc}")
+        log_q = math.log(1.0 - self.density)
+        mines = []
+        idx = -1
+        while True:
+            # Geometric gaps between Bernoulli(density) hits: O(mines) draws.
+            idx += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            if idx >= area:
+                break
+            if (cr * cs + idx // cs, cc * cs + idx % cs) not in self.safe_zone:
+                mines.append(idx)
+        return mines
+
+    def chunk(self, key):
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = self.build_chunk(key)
+        return chunk
+
+    def build_chunk(self, key):
+        cs = self.chunk_size
+        cr, cc = key
+        chunk = Chunk(cs * cs)
+        numbers = chunk.numbers
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                for idx in self.mines_in_chunk((cr + dr, cc + dc)):
+                    mr, mc = dr * cs + idx // cs, dc * cs + idx % cs
+                    for r in range(max(0, mr - 1), min(cs, mr + 2)):
+                        for c in range(max(0, mc - 1), min(cs, mc + 2)):
+                            if r != mr or c != mc:
+                                numbers[r * cs + c] += 1
+        for idx in self.mines_in_chunk(key):
+            chunk.mine[idx] = 1
+            numbers[idx] = 0
+        return chunk
+
+    def locate(self, r, c):
+        cs = self.chunk_size
+        return self.chunk((r // cs, c // cs)), (r % cs) * cs + c % cs
+
+    def cell(self, r, c):
+        if not self.mines_placed:
+            raise RuntimeError("cells are generated after the first reveal")
+        return Cell(*self.locate(r, c))
+
+    def neighbors(self, r, c):
+        return [
+            (nr, nc)
+            for nr in (r - 1, r, r + 1)
+            for nc in (c - 1, c, c + 1)
+            if (nr != r or nc != c) and self.in_bounds(nr, nc)
+        ]
+
+    def reveal(self, r, c):
+        if self.is_game_over or not self.in_bounds(r, c):
+            return True
+
+        if not self.mines_placed:
+            self.place_mines(first_click=(r, c))
+
+        return self.large_area_reveal(r, c)
+
+    def large_area_reveal(self, r, c):
+        chunk, idx = self.locate(r, c)
+        if chunk.revealed[idx] and self.pending_fill:
+            return self.flood(self.pending_fill)
+        if chunk.revealed[idx] or chunk.flagged[idx]:
+            self.publish("reveal", [])
+            return True
+
+        if chunk.mine[idx]:
+            chunk.revealed[idx] = 1
+            self.revealed_count += 1
+            self.is_game_over = True
+            self.publish("reveal", [CellChange(r, c, HIDDEN, REVEALED)])
+            return False
+
+        # A new opening is explored before any frontier left by an earlier cut.
+        self.pending_fill.append((r, c))
+        return self.flood(self.pending_fill)
+
+    def resume_reveal(self):
+        """Continue a flood fill that stopped at `reveal_limit`."""
+        if self.is_game_over or not self.pending_fill:
+            return True
+        return self.flood(self.pending_fill)
+
+    def flood(self, stack):
+        limit = self.reveal_limit if self.infinite else None
+        opened = []
+        while stack:
+            if limit is not None and len(opened) >= limit:
+                break
+            cr, cc = stack.pop()
+            chunk, idx = self.locate(cr, cc)
+            if chunk.revealed[idx] or chunk.flagged[idx]:
+                continue
+            chunk.revealed[idx] = 1
+            opened.append(CellChange(cr, cc, HIDDEN, REVEALED))
+
+            if chunk.numbers[idx] == 0:
+                for nr, nc in self.neighbors(cr, cc):
+                    nchunk, nidx = self.locate(nr, nc)
+                    if not nchunk.revealed[nidx] and not nchunk.flagged[nidx] and not nchunk.mine[nidx]:
+                        stack.append((nr, nc))
+
+        self.pending_fill = stack
+        self.revealed_count += len(opened)
+        if self.hidden_safe is not None:
+            self.hidden_safe -= len(opened)
+        self.publish("reveal_partial" if stack else "reveal", opened)
+        return True
+
+    def toggle_flag(self, r, c):
+        # Flags need the chunk, and chunks need the mine layer.
+        if not self.mines_placed or not self.in_bounds(r, c):
+            return None
+        chunk, idx = self.locate(r, c)
+        if chunk.revealed[idx]:
+            self.publish("flag", [])
+            return None
+        chunk.flagged[idx] ^= 1
+        flag = -1 if chunk.flagged[idx] else 1
+        self.flags_left += flag
+        self.flags_placed -= flag
+        if flag < 0:
+            self.publish("flag", [CellChange(r, c, HIDDEN, FLAGGED)])
+        else:
+            self.publish("flag", [CellChange(r, c, FLAGGED, HIDDEN)])
+
+    def check_win(self):
+        if self.infinite or self.hidden_safe > 0:
+            return False
+        self.is_game_over = True
+        return True
@@ -1,104 +1,448 @@
 import random
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+DIFFICULTIES = {
+    "Easy": (9, 9, 5),
+    "Intermediate": (16, 16, 40),
+    "Expert": (16, 30, 99),
+}
+
+HIDDEN = "hidden"
+FLAGGED = "flagged"
+REVEALED = "revealed"
+
+# One entry of GameCore.changes: a cell moving between HIDDEN/FLAGGED/REVEALED.
+CellChange = namedtuple("CellChange", ["row", "col", "old", "new"])
+
+
+class ChangeList:
+    """Cells that made the same state transition, as flat indices.
+
+    Iterating yields CellChange tuples; they are only built on demand so a
+    large opening costs one index list rather than a tuple per cell.
+    """
+
+    __slots__ = ("cols", "indices", "old", "new")
+
+    def __init__(self, cols, indices, old, new):
+        self.cols = cols
+        self.indices = indices
+        self.old = old
+        self.new = new
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        r, c = divmod(self.indices[i], self.cols)
+        return CellChange(r, c, self.old, self.new)
+
+    def __iter__(self):
+        cols, old, new = self.cols, self.old, self.new
+        for idx in self.indices:
+            r, c = divmod(idx, cols)
+            yield CellChange(r, c, old, new)
+
+
+class NeighborTable:
+    """Flat 8-neighbour adjacency for one board shape.
+
+    The neighbours of cell ``i`` (``i = r * cols + c``) are
+    ``indices[offsets[i]:offsets[i + 1]]``.
+    """
+
+    __slots__ = ("rows", "cols", "offsets", "indices")
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        offsets = array("i", [0])
+        indices = array("i")
+        for r in range(rows):
+            r_lo, r_hi = max(0, r - 1), min(rows, r + 2)
+            for c in range(cols):
+                c_lo, c_hi = max(0, c - 1), min(cols, c + 2)
+                for nr in range(r_lo, r_hi):
+                    base = nr * cols
+                    for nc in range(c_lo, c_hi):
+                        if nr != r or nc != c:
+                            indices.append(base + nc)
+                offsets.append(len(indices))
+        self.offsets = offsets
+        self.indices = indices
+
+    def of(self, idx):
+        return self.indices[self.offsets[idx]:self.offsets[idx + 1]]
+
+
+@lru_cache(maxsize=8)
+def neighbor_table(rows, cols):
+    return NeighborTable(rows, cols)
+
 
 class Cell:
-    def __init__(self):
-        self.is_mine: bool = False
-        self.is_revealed: bool = False
-        self.is_flagged: bool = False
-        self.neighbor_mines: int = 0
+    """Read-only view of one cell backed by the GameCore byte planes."""
+
+    __slots__ = ("_core", "_idx")
+
+    def __init__(self, core, idx):
+        self._core = core
+        self._idx = idx
+
+    @property
+    def is_mine(self) -> bool:
+        return bool(self._core.mine[self._idx])
+
+    @property
+    def is_revealed(self) -> bool:
+        return bool(self._core.revealed[self._idx])
+
+    @property
+    def is_flagged(self) -> bool:
+        return bool(self._core.flagged[self._idx])
+
+    @property
+    def neighbor_mines(self) -> int:
+        return self._core.numbers[self._idx]
+
+
+class GridView:
+    """Lets `game.grid[r][c]` and `for row in game.grid` keep working."""
+
+    __slots__ = ("_core",)
+
+    def __init__(self, core):
+        self._core = core
+
+    def __len__(self):
+        return self._core.rows
+
+    def __getitem__(self, r):
+        if not 0 <= r < self._core.rows:
+            raise IndexError(r)
+        return RowView(self._core, r)
+
+    def __iter__(self):
+        for r in range(self._core.rows):
+            yield RowView(self._core, r)
+
+
+class RowView:
+    __slots__ = ("_core", "_base")
+
+    def __init__(self, core, r):
+        self._core = core
+        self._base = r * core.cols
+
+    def __len__(self):
+        return self._core.cols
+
+    def __getitem__(self, c):
+        if not 0 <= c < self._core.cols:
+            raise IndexError(c)
+        return Cell(self._core, self._base + c)
+
+    def __iter__(self):
+        for c in range(self._core.cols):
+            yield Cell(self._core, self._base + c)
+
 
 class GameCore:
-    def __init__(self, rows=10, cols=10, mines=10):
+    def __init__(self, rows=10, cols=10, mines=10, check_counters=False, openings=False, seed=None):
         self.rows = rows
         self.cols = cols
         self.mines = mines
+        # Each board gets its own board_seed drawn from this stream, so a
+        # seeded core deals a reproducible sequence of boards.
+        self.rng = random.Random(seed)
+        self.board_seed = None
+        self.table = neighbor_table(rows, cols)
+        # Label every zero region once in place_mines so a click on a zero
+        # cell reveals its whole opening without a flood fill.
+        self.use_openings = openings
+        # Re-derive the running counters after every mutation; meant for tests.
+        self.check_counters = check_counters
 
         self.is_game_over = False
         self.mines_placed = False
         self.flags_left = mines
 
-        self.grid = [[Cell() for _ in range(self.cols)] for _ in range(self.rows)]
+        # Cells touched by the most recent reveal/flag/reset, see `subscribe`.
+        self.changes = []
+        self.listeners = []
+
+        self.clear_planes()
+
+    def clear_planes(self):
+        # One byte per cell and plane, indexed by r * cols + c.
+        size = self.rows * self.cols
+        self.mine = bytearray(size)
+        self.revealed = bytearray(size)
+        self.flagged = bytearray(size)
+        self.numbers = bytearray(size)
+        self.opening_of = None
+        self.openings = []
+
+        self.hidden_safe = size - self.mines
+        self.revealed_count = 0
+        self.flags_placed = 0
+        self.zero_cells = size
+
+    def scan_counters(self):
+        hidden_safe = revealed_count = zero_cells = 0
+        for is_mine, is_revealed, number in zip(self.mine, self.revealed, self.numbers):
+            if is_revealed:
+                revealed_count += 1
+            if not is_mine:
+                if not is_revealed:
+                    hidden_safe += 1
+                if number == 0:
+                    zero_cells += 1
+        if not self.mines_placed:
+            # Mines are still unplaced, so every hidden cell except `mines` of them is safe.
+            hidden_safe -= self.mines
+        return {
+            "hidden_safe": hidden_safe,
+            "revealed_count": revealed_count,
+            "flags_placed": sum(self.flagged),
+            "zero_cells": zero_cells,
+        }
+
+    def verify_counters(self):
+        expected = self.scan_counters()
+        actual = {name: getattr(self, name) for name in expected}
+        if actual != expected:
+            raise AssertionError(f"GameCore counters out of sync: {actual} != {expected}")
+        if self.flags_left != self.mines - self.flags_placed:
+            raise AssertionError(f"flags_left {self.flags_left} != {self.mines - self.flags_placed}")
+
+    def subscribe(self, callback):
+        """Call `callback(operation, changes)` after every board mutation."""
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def publish(self, operation, changes):
+        self.changes = changes
+        for callback in list(self.listeners):
+            callback(operation, changes)
+
+    @property
+    def grid(self):
+        return GridView(self)
+
+    def cell(self, r, c):
+        return Cell(self, r * self.cols + c)
 
     def neighbors(self, r, c):
-        neighbors_list = []
-        for nr in range(max(0, r - 1), min(self.rows, r + 2)):
-            for nc in range(max(0, c - 1), min(self.cols, c + 2)):
-                if (nr, nc) != (r, c):
-                    neighbors_list.append((nr, nc))
-
-        return neighbors_list
-    
+        cols = self.cols
+        return [divmod(nidx, cols) for nidx in self.table.of(r * cols + c)]
+
     def count_neighbor_mines(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r][c].is_mine:
-                    self.grid[r][c].neighbor_mines = 0
-                    continue
+        # Scatter each mine into its neighbours instead of gathering per cell.
+        mine = self.mine
+        numbers = bytearray(len(mine))
+        offsets, indices = self.table.offsets, self.table.indices
+        placed = 0
+        idx = mine.find(1)
+        while idx != -1:
+            placed += 1
+            for nidx in indices[offsets[idx]:offsets[idx + 1]]:
+                numbers[nidx] += 1
+            idx = mine.find(1, idx + 1)
+
+        idx = mine.find(1)
+        while idx != -1:
+            numbers[idx] = 0
+            idx = mine.find(1, idx + 1)
+        self.numbers = numbers
+        self.zero_cells = numbers.count(0) - placed
 
-                count = 0
-                for nr, nc in self.neighbors(r, c):
-                    if self.grid[nr][nc].is_mine:
-                        count += 1
-                self.grid[r][c].neighbor_mines = count
+    def place_mines(self, first_click=None, safe_first=True, board_seed=None):
+        """Place mines from `board_seed`, or from the next seed of `self.rng`."""
+        size = self.rows * self.cols
+        if board_seed is None:
+            board_seed = self.rng.getrandbits(63)
+        self.board_seed = board_seed
 
-    def place_mines(self, first_click=None, safe_first=True):
-        all_cells = [(r, c) for r in range(self.rows) for c in range(self.cols)]
-        if safe_first and first_click and first_click in all_cells:
-            all_cells.remove(first_click)
+        skip = None
+        if safe_first and first_click:
+            fr, fc = first_click
+            if 0 <= fr < self.rows and 0 <= fc < self.cols:
+                skip = fr * self.cols + fc
 
-        for (r, c) in random.sample(all_cells, self.mines):
-            self.grid[r][c].is_mine = True
+        # Sample from the cells with `skip` cut out, then shift indices past it.
+        rng = random.Random(board_seed)
+        mine = self.mine
+        if skip is None:
+            for idx in rng.sample(range(size), self.mines):
+                mine[idx] = 1
+        else:
+            for idx in rng.sample(range(size - 1), self.mines):
+                mine[idx + (idx >= skip)] = 1
 
         self.count_neighbor_mines()
+        if self.use_openings:
+            self.label_openings()
         self.mines_placed = True
+        if self.check_counters:
+            self.verify_counters()
+
+    def label_openings(self):
+        """Group zero cells into openings, each with its numbered border.
+
+        `opening_of[i]` is the opening id of zero cell `i` (-1 otherwise) and
+        `openings[id]` lists every cell that clicking the opening reveals.
+        """
+        mine, numbers = self.mine, self.numbers
+        offsets, indices = self.table.offsets, self.table.indices
+        opening_of = array("i", [-1]) * len(numbers)
+        openings = []
+        border_seen = bytearray(len(numbers))
+
+        idx = numbers.find(0)
+        while idx != -1:
+            if not mine[idx] and opening_of[idx] == -1:
+                label = len(openings)
+                opening_of[idx] = label
+                members = array("i", [idx])
+                border = []
+                stack = [idx]
+                while stack:
+                    cur = stack.pop()
+                    for nidx in indices[offsets[cur]:offsets[cur + 1]]:
+                        if numbers[nidx]:
+                            if border_seen[nidx] != 1:
+                                border_seen[nidx] = 1
+                                border.append(nidx)
+                        elif opening_of[nidx] == -1:
+                            opening_of[nidx] = label
+                            members.append(nidx)
+                            stack.append(nidx)
+                for nidx in border:
+                    border_seen[nidx] = 0
+                members.extend(border)
+                openings.append(members)
+            idx = numbers.find(0, idx + 1)
+
+        self.opening_of = opening_of
+        self.openings = openings
 
     def reveal(self, r, c):
+        return self.reveal_many([(r, c)])
+
+    def reveal_many(self, cells):
+        """Reveal several cells as one operation sharing a single flood fill."""
         if self.is_game_over:
             return True
 
-        if not self.mines_placed:
-            self.place_mines(first_click=(r, c))
+        cells = list(cells)
+        if not self.mines_placed and cells:
+            self.place_mines(first_click=cells[0])
 
-        return self.large_area_reveal(r, c)
+        cols = self.cols
+        result = self.open_cells([r * cols + c for r, c in cells])
+        if self.check_counters:
+            self.verify_counters()
+        return result
 
-    def large_area_reveal(self, r, c):
-        start = self.grid[r][c]
-        if start.is_revealed or start.is_flagged:
+    def chord(self, r, c):
+        """Reveal the unflagged neighbours of a number whose flags are all placed."""
+        if self.is_game_over:
             return True
 
-        if start.is_mine:
-            start.is_revealed = True
-            self.is_game_over = True
-            return False
+        idx = r * self.cols + c
+        number = self.numbers[idx]
+        if not self.revealed[idx] or self.mine[idx] or number == 0:
+            self.publish("chord", [])
+            return True
+
+        flagged, revealed = self.flagged, self.revealed
+        around = self.table.of(idx)
+        if sum(flagged[nidx] for nidx in around) != number:
+            self.publish("chord", [])
+            return True
+
+        result = self.open_cells([nidx for nidx in around if not revealed[nidx] and not flagged[nidx]], "chord")
+        if self.check_counters:
+            self.verify_counters()
+        return result
+
+    def large_area_reveal(self, r, c):
+        return self.open_cells([r * self.cols + c])
+
+    def open_cells(self, starts, operation="reveal"):
+        """Reveal `starts` (flat indices) and flood out from zeros in one pass.
+
+        Returns False if any start was a mine, which ends the game.
+        """
+        mine, revealed, flagged, numbers = self.mine, self.revealed, self.flagged, self.numbers
+        offsets, indices = self.table.offsets, self.table.indices
+        opened = []
+        mines_hit = 0
+        stack = []
+        for start in starts:
+            if revealed[start] or flagged[start]:
+                continue
+            if mine[start]:
+                revealed[start] = 1
+                opened.append(start)
+                mines_hit += 1
+                continue
+            if self.opening_of is not None and numbers[start] == 0:
+                members = self.openings[self.opening_of[start]]
+                # A flag inside the opening blocks the fill, so only the
+                # unflagged case can be revealed in one step.
+                if not self.flags_placed or not any(flagged[idx] for idx in members):
+                    for idx in members:
+                        if not revealed[idx]:
+                            revealed[idx] = 1
+                            opened.append(idx)
+                    continue
+            stack.append(start)
 
-        stack = [(r, c)]
         while stack:
-            cr, cc = stack.pop()
-            cell = self.grid[cr][cc]
-            if cell.is_revealed or cell.is_flagged:
+            idx = stack.pop()
+            if revealed[idx] or flagged[idx]:
                 continue
-            cell.is_revealed = True
+            revealed[idx] = 1
+            opened.append(idx)
 
-            if cell.neighbor_mines == 0:
-                for nr, nc in self.neighbors(cr, cc):
-                    ncell = self.grid[nr][nc]
-                    if not ncell.is_revealed and not ncell.is_flagged and not ncell.is_mine:
-                        stack.append((nr, nc))
-        return True
+            if numbers[idx] == 0:
+                for nidx in indices[offsets[idx]:offsets[idx + 1]]:
+                    if not revealed[nidx] and not flagged[nidx] and not mine[nidx]:
+                        stack.append(nidx)
+
+        self.revealed_count += len(opened)
+        self.hidden_safe -= len(opened) - mines_hit
+        if mines_hit:
+            self.is_game_over = True
+        self.publish(operation, ChangeList(self.cols, opened, HIDDEN, REVEALED))
+        return not mines_hit
 
     def toggle_flag(self, r, c):
-        cell = self.grid[r][c]
-        if cell.is_revealed:
+        idx = r * self.cols + c
+        if self.revealed[idx]:
+            self.publish("flag", [])
             return None
-        cell.is_flagged = not cell.is_flagged
-        flag = -1 if cell.is_flagged else 1
+        self.flagged[idx] ^= 1
+        flag = -1 if self.flagged[idx] else 1
         self.flags_left += flag
+        self.flags_placed -= flag
+        if flag < 0:
+            self.publish("flag", [CellChange(r, c, HIDDEN, FLAGGED)])
+        else:
+            self.publish("flag", [CellChange(r, c, FLAGGED, HIDDEN)])
+        if self.check_counters:
+            self.verify_counters()
 
     def check_win(self):
-        for row in self.grid:
-            for cell in row:
-                if not cell.is_mine and not cell.is_revealed:
-                    return False
+        if self.hidden_safe > 0:
+            return False
         self.is_game_over = True
         return True
 
@@ -106,4 +450,8 @@ class GameCore:
         self.is_game_over = False
         self.mines_placed = False
         self.flags_left = self.mines
-        self.grid = [[Cell() for _ in range(self.cols)] for _ in range(self.rows)]
+        self.board_seed = None
+        self.clear_planes()
+        if self.check_counters:
+            self.verify_counters()
+        self.publish("reset", [])
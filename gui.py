@@ -3,10 +3,13 @@ import sys
 from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
+from analytics_jobs import AnalyticsJob, AnalyticsWorker
 from analytics_tab import AnalyticsLog, AnalyticsTab
-from analytics import generate_report
-from game_logic import GameCore
+from board_view import BOARD_VIEWS
+from game_logic import DIFFICULTIES, GameCore
 from highscore import HighScorePanel, ScoreStore, score_key
+from instrumentation import NULL_TRACE
+from solver import solve
 
 
 class Minesweeper:
@@ -15,39 +18,64 @@ class Minesweeper:
     CELL_BG = "#E5E7EB"       
     CELL_BG_HOVER = "#D1D5DB" 
     REVEALED_BG = "#F3F4F6"
+    HINT_BG = "#BBF7D0"
     BOARD_BG = "#F8FAFC"
     PANEL_BG = "#FFFFFF"
     PANEL_BORDER = "#E5E7EB"
     BOARD_MAX_WIDTH = 920
     BOARD_MAX_HEIGHT = 640
 
-    def __init__(self, root, boards=100, rows=10, cols=10, mines=10):
+    def __init__(self, root, boards=100, rows=10, cols=10, mines=10, renderer="canvas", latency=None):
+        if renderer not in BOARD_VIEWS:
+            raise ValueError(f"unknown renderer {renderer!r}; choose from {sorted(BOARD_VIEWS)}")
         self.root = root
+        self.renderer = renderer
         self.boards = boards
         self.rows = rows
         self.cols = cols
         self.mines = mines
 
         self.game = GameCore(self.rows, self.cols, self.mines)
-        self.buttons = {}
         self.timer_seconds = 0
         self.timer_job = None
+        self.mines_shown = False
+        self.hint_cell = None
+        # Render scheduler: cells and counters waiting for the next idle
+        # flush, and the one cell under the pointer.
+        self.dirty_cells = set()
+        self.redraw_pending = False
+        self.flush_job = None
+        self.hover_cell = None
+        self.label_texts = {}
+        # Opt-in latency tracing: `latency` is an instrumentation.LatencyRecorder.
+        # Traces of handled input wait in `paint_traces` until the flush
+        # that paints their result.
+        self.latency = latency
+        self.paint_traces = []
+        self.latency_overlay = None
+        self.latency_overlay_job = None
         self.username = "Player"
-        scores_path = os.path.join(os.path.dirname(__file__), "user.csv")
-
-        self.score_store = ScoreStore(scores_path)
+        # The CSV-backed stores and the report cache are opened on first use
+        # so reading them does not delay the first board.
+        self.scores_path = os.path.join(os.path.dirname(__file__), "user.csv")
+        self._score_store = None
         self.last_win_key = None
         base_dir = os.path.dirname(__file__)
         self.analytics_reports_dir = os.path.join(base_dir, "analytics_reports")
         os.makedirs(self.analytics_reports_dir, exist_ok=True)
-        analytics_log_path = os.path.join(base_dir, "analytic.csv")
-
-        self.analytics_log = AnalyticsLog(analytics_log_path)
+        self.analytics_log_path = os.path.join(base_dir, "analytic.csv")
+        self.analytics_cache_dir = os.path.join(base_dir, "analytics_cache")
+        self._analytics_log = None
+        self._analytics_cache = None
         self.analytics_boards_var = tk.StringVar(value="100")
         self.analytics_rows_var = tk.StringVar(value=str(rows))
         self.analytics_cols_var = tk.StringVar(value=str(cols))
         self.analytics_mines_var = tk.StringVar(value=str(mines))
+        self.analytics_workers_var = tk.StringVar(value=str(min(4, os.cpu_count() or 1)))
         self.analytics_config_frame = None
+        self.analytics_worker = AnalyticsWorker(self.build_report)
+        self.analytics_poll_job = None
+        self.report_counter = 0
 
         if sys.platform == "darwin":
             self.cell_font = ("Helvetica", 10, "bold")
@@ -60,7 +88,26 @@ class Minesweeper:
 
         self.build_ui()
         self.create_board()
-        self.refresh_leaderboard_tab()
+
+    @property
+    def score_store(self):
+        if self._score_store is None:
+            self._score_store = ScoreStore(self.scores_path)
+        return self._score_store
+
+    @property
+    def analytics_log(self):
+        if self._analytics_log is None:
+            self._analytics_log = AnalyticsLog(self.analytics_log_path)
+        return self._analytics_log
+
+    @property
+    def analytics_cache(self):
+        if self._analytics_cache is None:
+            from report_cache import ReportCache
+
+            self._analytics_cache = ReportCache(self.analytics_cache_dir)
+        return self._analytics_cache
 
     def build_ui(self):
         self.root.configure(bg=self.BOARD_BG)
@@ -130,14 +177,12 @@ class Minesweeper:
         self.reset_btn = tk.Button(self.side_panel, text="Reset Game", width=10, font=("Segoe UI Emoji", 12), command=self.reset)
         self.reset_btn.pack(fill=tk.X, padx=10, pady=(0, 8))
 
+        tk.Button(self.side_panel, text="Hint", font=self.ui_font, command=self.show_hint).pack(fill=tk.X, padx=10, pady=(0, 8))
+
         self.flag_mode_active = False
 
         self.difficulty_var = tk.StringVar(value="Intermediate")
-        self.difficulty_map = {
-            "Easy": (9, 9, 5),
-            "Intermediate": (16, 16, 40),
-            "Expert": (16, 30, 99),
-        }
+        self.difficulty_map = dict(DIFFICULTIES)
         self.difficulty_menu = tk.OptionMenu(self.side_panel, self.difficulty_var, *self.difficulty_map.keys(), command=self.on_change_difficulty)
         self.difficulty_menu.config(font=("Segoe UI Emoji", 12), width=10)
         self.difficulty_menu.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -160,7 +205,20 @@ class Minesweeper:
             text="Run Analytics",
             command=self.run_analytics_report,
             font=self.ui_font,
-        ).pack(fill=tk.X, padx=12, pady=(0, 10))
+        ).pack(fill=tk.X, padx=12, pady=(0, 4))
+
+        progress_frame = tk.Frame(self.side_panel, bg=self.PANEL_BG)
+        progress_frame.pack(fill=tk.X, padx=12, pady=(0, 2))
+        self.analytics_progress = ttk.Progressbar(progress_frame, mode="determinate", maximum=1.0)
+        self.analytics_progress.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.analytics_cancel_btn = tk.Button(
+            progress_frame, text="Cancel", font=self.ui_font, state=tk.DISABLED, command=self.cancel_analytics
+        )
+        self.analytics_cancel_btn.pack(side=tk.LEFT, padx=(6, 0))
+        self.analytics_progress_label = tk.Label(
+            self.side_panel, text="", bg=self.PANEL_BG, fg="#6B7280", font=("Segoe UI", 10), anchor="w"
+        )
+        self.analytics_progress_label.pack(fill=tk.X, padx=12, pady=(0, 10))
 
         self.content_notebook = ttk.Notebook(self.main_frame)
         self.content_notebook.pack(side=tk.LEFT, padx=(10, 0), fill=tk.BOTH, expand=True)
@@ -169,39 +227,67 @@ class Minesweeper:
         self.content_notebook.add(self.game_tab, text="Game")
         self.board_frame = tk.Frame(self.game_tab, bg=self.PANEL_BG, bd=1, relief=tk.SOLID)
         self.board_frame.pack(padx=0, pady=0)
-
-        self.highscore_panel = HighScorePanel(self.content_notebook, self.PANEL_BG, self.ui_font, self.score_store)
-        self.content_notebook.add(self.highscore_panel.frame, text="High Scores")
-
-        self.analytics_tab = AnalyticsTab(
-            self.content_notebook,
-            self.PANEL_BG,
-            self.ui_font,
-            self.analytics_log,
-        )
-        self.content_notebook.add(self.analytics_tab.frame, text="Analytics")
+        self.board_view = BOARD_VIEWS[self.renderer](self.board_frame, self)
+
+        # The other tabs start as empty pages and are filled the first time
+        # they are shown.
+        self.highscore_page = tk.Frame(self.content_notebook, bg=self.PANEL_BG)
+        self.content_notebook.add(self.highscore_page, text="High Scores")
+        self.analytics_page = tk.Frame(self.content_notebook, bg=self.PANEL_BG)
+        self.content_notebook.add(self.analytics_page, text="Analytics")
+        self.tab_builders = {
+            str(self.highscore_page): self.build_highscore_tab,
+            str(self.analytics_page): self.build_analytics_tab,
+        }
+        self.content_notebook.bind("<<NotebookTabChanged>>", lambda e: self.build_tab(self.content_notebook.select()))
 
         self.status = tk.Label(
             self.root,
-            text="Left-click reveals, right-click or Shift+Click flags (press F to toggle flag mode). Press R to reset.",
+            text="Left-click reveals, right-click or Shift+Click flags (press F to toggle flag mode). Double- or middle-click a number to chord. Press R to reset, +/- or Ctrl+wheel to zoom.",
             bg=self.BOARD_BG,
             fg="#374151",
             font=self.ui_font,
         )
         self.status.pack(padx=10, pady=(0, 6), anchor="w")
 
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
         try:
             self.root.bind("<r>", lambda e: self.reset())
             self.root.bind("<R>", lambda e: self.reset())
             self.root.bind("<f>", lambda e: self.toggle_flag_mode())
             self.root.bind("<F>", lambda e: self.toggle_flag_mode())
+            self.root.bind("<plus>", lambda e: self.zoom_board(1))
+            self.root.bind("<equal>", lambda e: self.zoom_board(1))
+            self.root.bind("<minus>", lambda e: self.zoom_board(-1))
+            if self.latency is not None:
+                self.root.bind("<F12>", lambda e: self.toggle_latency_overlay())
         except Exception:
             pass
 
+    def build_highscore_tab(self):
+        self.highscore_panel = HighScorePanel(self.highscore_page, self.PANEL_BG, self.ui_font, self.score_store)
+        self.highscore_panel.frame.pack(fill=tk.BOTH, expand=True)
+        self.highscore_panel.refresh(self.last_win_key)
+
+    def build_analytics_tab(self):
+        self.analytics_tab = AnalyticsTab(self.analytics_page, self.PANEL_BG, self.ui_font, self.analytics_log)
+        self.analytics_tab.frame.pack(fill=tk.BOTH, expand=True)
+
+    def build_tab(self, page):
+        builder = self.tab_builders.pop(str(page), None)
+        if builder:
+            builder()
+
+    def show_tab(self, page):
+        # Build before selecting so callers can use the tab straight away.
+        self.build_tab(page)
+        self.content_notebook.select(page)
+
     def build_analytics_inputs(self):
         tk.Label(
             self.analytics_config_frame,
-            text="Boards / Rows / Columns / Mines",
+            text="Boards / Rows / Columns / Mines / Workers",
             wraplength=180,
             justify=tk.LEFT,
             bg=self.PANEL_BG,
@@ -217,6 +303,7 @@ class Minesweeper:
             ("Rows", self.analytics_rows_var),
             ("Columns", self.analytics_cols_var),
             ("Mines", self.analytics_mines_var),
+            ("Workers", self.analytics_workers_var),
         ):
             wrapper = tk.Frame(inputs_frame, bg=self.PANEL_BG)
             tk.Label(wrapper, text=label, bg=self.PANEL_BG, font=("Segoe UI", 10)).pack(anchor="w")
@@ -245,9 +332,6 @@ class Minesweeper:
         ).pack(fill=tk.X, pady=(4, 0))
 
     def create_board(self):
-        for w in self.board_frame.winfo_children():
-            w.destroy()
-        self.buttons.clear()
         self.game.reset()
         if self.last_win_key is not None:
             self.last_win_key = None
@@ -258,44 +342,24 @@ class Minesweeper:
         self.update_counters()
         self.reset_btn.config(text="Reset Game")
 
-        width_limit = self.BOARD_MAX_WIDTH // max(1, self.cols)
-        height_limit = self.BOARD_MAX_HEIGHT // max(1, self.rows)
-        self.cell_px = max(18, min(48, width_limit, height_limit))
-
-        try:
-            self.board_frame.config(width=self.cell_px * self.cols, height=self.cell_px * self.rows)
-            self.board_frame.grid_propagate(False)
-        except Exception:
-            pass
+        view = self.board_view
+        if (view.rows, view.cols) == (self.rows, self.cols) and view.cell_px:
+            # Same shape: keep the player's zoom and scroll position.
+            self.cell_px = view.cell_px
+        else:
+            width_limit = self.BOARD_MAX_WIDTH // max(1, self.cols)
+            height_limit = self.BOARD_MAX_HEIGHT // max(1, self.rows)
+            self.cell_px = max(18, min(48, width_limit, height_limit))
 
         self.set_flag_mode(False)
+        self.mines_shown = False
+        self.hint_cell = None
+        self.hover_cell = None
+        self.cancel_flush()
 
-        for r in range(self.rows):
-            self.board_frame.grid_rowconfigure(r, weight=1, uniform="row", minsize=self.cell_px)
-        for c in range(self.cols):
-            self.board_frame.grid_columnconfigure(c, weight=1, uniform="col", minsize=self.cell_px)
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                font_size = max(8, int(self.cell_px * 0.45))
-                b = tk.Button(
-                    self.board_frame,
-                    text="",
-                    bg=self.CELL_BG,
-                    activebackground=self.CELL_BG_HOVER,
-                    font=("Segoe UI", font_size, "bold"),
-                    relief=tk.RAISED,
-                    command=lambda r=r, c=c: self.handle_left_click(r, c),
-                )
-                b.bind("<Button-3>", lambda e, r=r, c=c: self.flag_cell_event(e, r, c))
-                b.bind("<Button-2>", lambda e, r=r, c=c: self.flag_cell_event(e, r, c))
-                b.bind("<Control-Button-1>", lambda e, r=r, c=c: self.flag_cell_event(e, r, c))
-                b.bind("<Shift-Button-1>", lambda e, r=r, c=c: self.flag_cell_event(e, r, c))
-
-                b.bind("<Enter>", lambda e, r=r, c=c: self.hover(r, c, True))
-                b.bind("<Leave>", lambda e, r=r, c=c: self.hover(r, c, False))
-                b.grid(row=r, column=c, sticky="nsew")
-                self.buttons[(r, c)] = b
+        trace = self.begin_trace("new_board")
+        self.board_view.build(self.rows, self.cols, self.cell_px)
+        trace.stage("build")
 
         if not getattr(self, "safe_first_var", None) or not self.safe_first_var.get():
             try:
@@ -307,6 +371,7 @@ class Minesweeper:
             self.root.update_idletasks()
         except Exception:
             pass
+        trace.finish("paint")
 
     def handle_left_click(self, r, c):
         if self.flag_mode_active:
@@ -319,19 +384,47 @@ class Minesweeper:
         self.toggle_flag(r, c)
         return "break"
 
+    def chord_cell_event(self, _event, r, c):
+        self.chord_cell(r, c)
+        return "break"
+
     def reveal_cell(self, r, c):
         if self.game.is_game_over:
             return
         if self.timer_job is None and self.timer_seconds == 0:
             self.start_timer()
+        trace = self.begin_trace("reveal")
+        self.clear_hint()
         ok = self.game.reveal(r, c)
-        self.refresh_ui()
+        trace.stage("game")
+        self.finish_reveal(ok, trace)
+
+    def chord_cell(self, r, c):
+        if self.game.is_game_over or self.flag_mode_active:
+            return
+        trace = self.begin_trace("chord")
+        self.clear_hint()
+        ok = self.game.chord(r, c)
+        trace.stage("game")
+        self.finish_reveal(ok, trace)
+
+    def finish_reveal(self, ok, trace=NULL_TRACE):
+        self.refresh_ui(self.game.changes)
+        trace.stage("refresh_ui")
+        won = ok and self.game.check_win()
+        trace.stage("check_win")
+        self.await_paint(trace)
         if not ok:
             self.show_mines()
             self.game_over(False)
-        elif self.game.check_win():
+        elif won:
             self.game_over(True)
 
+    def zoom_board(self, step):
+        zoom = getattr(self.board_view, "zoom", None)
+        if zoom is not None:
+            zoom(step)
+
     def toggle_flag_mode(self):
         self.set_flag_mode(not self.flag_mode_active)
 
@@ -341,39 +434,154 @@ class Minesweeper:
     def toggle_flag(self, r, c):
         if self.game.is_game_over:
             return
+        trace = self.begin_trace("flag")
+        self.clear_hint()
         self.game.toggle_flag(r, c)
-        self.refresh_ui()
+        trace.stage("game")
+        self.refresh_ui(self.game.changes)
+        trace.stage("refresh_ui")
+        self.await_paint(trace)
+
+    def refresh_ui(self, changes=None):
+        # A change list longer than the view (a big opening on a large
+        # board) is cheaper to apply by repainting what is on screen.
+        if changes is None or self.redraw_pending or len(changes) + len(self.dirty_cells) > self.board_view.shown_count():
+            self.redraw_pending = True
+            self.dirty_cells.clear()
+        else:
+            self.dirty_cells.update((change.row, change.col) for change in changes)
+        self.schedule_flush()
+
+    def mark_dirty(self, r, c):
+        if not self.redraw_pending:
+            self.dirty_cells.add((r, c))
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        # Everything queued before Tk goes idle is painted in one pass, so
+        # bursts of clicks or pointer motion never build up a backlog.
+        if self.flush_job is None:
+            self.flush_job = self.root.after_idle(self.flush_ui)
+
+    def cancel_flush(self):
+        if self.flush_job is not None:
+            try:
+                self.root.after_cancel(self.flush_job)
+            except Exception:
+                pass
+            self.flush_job = None
+        self.dirty_cells.clear()
+        self.redraw_pending = False
+        # Their result will never be painted, so they are not latencies.
+        for trace in self.paint_traces:
+            trace.discard()
+        self.paint_traces.clear()
+
+    def flush_ui(self):
+        if self.flush_job is not None:
+            try:
+                self.root.after_cancel(self.flush_job)
+            except Exception:
+                pass
+            self.flush_job = None
+        traces, self.paint_traces = self.paint_traces, []
+        for trace in traces:
+            trace.stage("idle_wait")
+        if self.redraw_pending:
+            self.redraw_pending = False
+            self.board_view.redraw()
+        else:
+            dirty, self.dirty_cells = self.dirty_cells, set()
+            for r, c in dirty:
+                self.draw_cell(r, c)
+        self.update_counters()
+        for trace in traces:
+            trace.finish("paint")
+
+    def begin_trace(self, operation):
+        if self.latency is None:
+            return NULL_TRACE
+        return self.latency.start(operation, rows=self.rows, cols=self.cols, renderer=self.renderer)
+
+    def await_paint(self, trace):
+        if trace is not NULL_TRACE:
+            self.paint_traces.append(trace)
+            self.schedule_flush()
+
+    def toggle_latency_overlay(self):
+        if self.latency_overlay is not None:
+            if self.latency_overlay_job is not None:
+                self.root.after_cancel(self.latency_overlay_job)
+                self.latency_overlay_job = None
+            self.latency_overlay.destroy()
+            self.latency_overlay = None
+            return
+        self.latency_overlay = tk.Label(
+            self.game_tab, text="", justify=tk.LEFT, anchor="nw", bg="#111827", fg="#F9FAFB",
+            font=("Consolas", 9), padx=6, pady=4,
+        )
+        self.latency_overlay.place(relx=1.0, y=4, x=-4, anchor="ne")
+        self.update_latency_overlay()
 
-    def refresh_ui(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.game.grid[r][c]
-                btn = self.buttons[(r, c)]
-                if cell.is_flagged:
-                    btn.config(text="🚩", fg="#EF4444", bg=self.CELL_BG)
-                elif cell.is_revealed:
-                    btn.config(state="disabled", relief=tk.SUNKEN, bg=self.REVEALED_BG, disabledforeground="#111827")
-                    if cell.is_mine:
-                        btn.config(text="💣", bg="#FCA5A5")
-                    elif cell.neighbor_mines > 0:
-                        btn.config(text=str(cell.neighbor_mines), fg=self.NUMBER_COLORS.get(cell.neighbor_mines, "#111827"))
-                    else:
-                        btn.config(text="")
-                else:
-                    btn.config(text="", bg=self.CELL_BG)
+    def update_latency_overlay(self):
+        self.latency_overlay.config(text=f"{self.rows}x{self.cols} {self.renderer}\n{self.latency.format_summary()}")
+        self.latency_overlay_job = self.root.after(500, self.update_latency_overlay)
 
-        self.update_counters()
+    def cell_style(self, r, c):
+        """(text, fg, bg, sunken) for the cell's current state."""
+        cell = self.game.grid[r][c]
+        if self.mines_shown and cell.is_mine and not cell.is_revealed:
+            return "💣", "#111827", "#FEE2E2", False
+        if (r, c) == self.hint_cell and not cell.is_revealed and not cell.is_flagged:
+            return "", "#111827", self.HINT_BG, False
+        if (r, c) == self.hover_cell and not cell.is_revealed and not cell.is_flagged and not self.game.is_game_over:
+            return "", "#111827", self.CELL_BG_HOVER, False
+        if cell.is_flagged:
+            return "🚩", "#EF4444", self.CELL_BG, False
+        if not cell.is_revealed:
+            return "", "#111827", self.CELL_BG, False
+        if cell.is_mine:
+            return "💣", "#111827", "#FCA5A5", True
+        if cell.neighbor_mines > 0:
+            return str(cell.neighbor_mines), self.NUMBER_COLORS.get(cell.neighbor_mines, "#111827"), self.REVEALED_BG, True
+        return "", "#111827", self.REVEALED_BG, True
+
+    def draw_cell(self, r, c):
+        self.board_view.paint(r, c, *self.cell_style(r, c))
+
+    def show_hint(self):
+        if self.game.is_game_over:
+            return
+        if not self.game.mines_placed:
+            self.status.config(text="Hint: the first click is always safe.")
+            return
+        solution = solve(self.game)
+        if solution.safe:
+            r, c = solution.safe[0]
+            text = f"Hint: row {r + 1}, column {c + 1} is safe."
+        else:
+            r, c = solution.best_guess()
+            chance = solution.probabilities[(r, c)]
+            text = f"Hint: no safe cell; row {r + 1}, column {c + 1} has a {chance:.0%} mine chance."
+        self.clear_hint()
+        self.hint_cell = (r, c)
+        self.mark_dirty(r, c)
+        self.status.config(text=text)
+
+    def clear_hint(self):
+        if self.hint_cell is not None:
+            cell, self.hint_cell = self.hint_cell, None
+            self.mark_dirty(*cell)
 
     def show_mines(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.game.grid[r][c]
-                if cell.is_mine:
-                    self.buttons[(r, c)].config(text="💣", bg="#FEE2E2")
+        self.mines_shown = True
+        self.refresh_ui()
 
     def game_over(self, won):
         self.game.is_game_over = True
         self.stop_timer()
+        # Paint the final board before the modal dialog blocks the idle loop.
+        self.flush_ui()
         message = "You Win! 🎉" if won else "Game over! 😵"
         messagebox.showinfo("Game Over", message)
         record = None
@@ -384,8 +592,8 @@ class Minesweeper:
                 record = self.save_score(prompted, won)
                 self.last_win_key = score_key(record) if record else None
                 self.refresh_leaderboard_tab()
-                if hasattr(self, "content_notebook") and hasattr(self, "highscore_panel"):
-                    self.content_notebook.select(self.highscore_panel.frame)
+                if hasattr(self, "content_notebook"):
+                    self.show_tab(self.highscore_page)
         else:
             self.last_win_key = None
             self.refresh_leaderboard_tab()
@@ -411,13 +619,14 @@ class Minesweeper:
             rows = int(self.analytics_rows_var.get())
             cols = int(self.analytics_cols_var.get())
             mines = int(self.analytics_mines_var.get())
+            workers = int(self.analytics_workers_var.get())
         except ValueError:
             if show_errors:
                 messagebox.showwarning("Analytics", "Analytics settings must be integers.")
             return None
-        if boards <= 0 or rows <= 0 or cols <= 0:
+        if boards <= 0 or rows <= 0 or cols <= 0 or workers <= 0:
             if show_errors:
-                messagebox.showwarning("Analytics", "Boards, Rows and columns must be positive.")
+                messagebox.showwarning("Analytics", "Boards, rows, columns and workers must be positive.")
             return None
         if mines < 0:
             if show_errors:
@@ -427,43 +636,107 @@ class Minesweeper:
             if show_errors:
                 messagebox.showwarning("Analytics", "Mines must be less than the number of cells.")
             return None
-        return boards, rows, cols, mines
+        return boards, rows, cols, mines, workers
 
     def run_analytics_report(self):
         settings = self.get_analytics_settings()
         if not settings:
             return
-        boards, rows, cols, mines = settings
+        boards, rows, cols, mines, workers = settings
         now = datetime.now()
         timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-        unix_suffix = str(int(now.timestamp()))
-        filename = f"Report_{unix_suffix}.pdf"
-        pdf_path = os.path.join(self.analytics_reports_dir, filename)
-        try:
-            generate_report(rows, cols, mines, boards, pdf_path)
-        except Exception as exc:
-            messagebox.showwarning("Analytics", f"Failed to build analytics report:\n{exc}")
-            return
-        record = {
-            "created_at": timestamp,
-            "boards": boards,
-            "rows": rows,
-            "cols": cols,
-            "mines": mines,
-            "pdf_path": pdf_path,
-        }
+        pdf_path = self.next_report_path(int(now.timestamp()))
+        # Open the cache on this thread so the worker never races the lazy property.
+        self.analytics_cache
+        self.analytics_worker.submit(AnalyticsJob(rows, cols, mines, boards, workers, pdf_path, timestamp))
+        self.analytics_cancel_btn.config(state=tk.NORMAL)
+        self.analytics_progress_label.config(text=f"Queued {boards} boards ({self.analytics_worker.pending()} job(s))")
+        if self.analytics_poll_job is None:
+            self.analytics_poll_job = self.root.after(100, self.poll_analytics)
+
+    def next_report_path(self, unix_time):
+        # Jobs queue without blocking, so several can be submitted in one
+        # second; the per-session counter keeps their PDFs apart, and the
+        # existence check skips files left by an earlier session.
+        while True:
+            self.report_counter += 1
+            path = os.path.join(self.analytics_reports_dir, f"Report_{unix_time}_{self.report_counter}.pdf")
+            if not os.path.exists(path):
+                return path
+
+    def build_report(self, job, progress):
+        """Runs on the analytics worker thread."""
+        # Deferred: analytics pulls in NumPy, matplotlib and seaborn.
+        from analytics import generate_report
+
+        generate_report(
+            job.rows,
+            job.cols,
+            job.mines,
+            job.boards,
+            job.pdf_path,
+            workers=job.workers,
+            cache=self.analytics_cache,
+            progress=progress,
+            cancel=job.cancel_event,
+        )
+
+    def close(self):
+        """Window close: stop report jobs so their process pools do not keep the app alive."""
+        if self.analytics_poll_job is not None:
+            self.root.after_cancel(self.analytics_poll_job)
+            self.analytics_poll_job = None
+        self.analytics_worker.shutdown()
+        self.root.destroy()
+
+    def cancel_analytics(self):
+        self.analytics_worker.cancel()
+        self.analytics_progress_label.config(text="Cancelling...")
+
+    def poll_analytics(self):
+        # Check before draining: once nothing is pending, every event of the
+        # finished jobs has already been posted and is picked up below.
+        busy = self.analytics_worker.pending()
+        for kind, job, payload in self.analytics_worker.poll():
+            if kind == "progress":
+                done, total = payload
+                self.analytics_progress.config(value=done / total)
+                text = "Rendering report..." if done >= total else f"{done} / {total} boards"
+                self.analytics_progress_label.config(text=text)
+            elif kind == "done":
+                self.finish_analytics_job(job)
+            elif kind == "cancelled":
+                self.analytics_progress.config(value=0.0)
+                self.analytics_progress_label.config(text="Report cancelled.")
+            else:
+                self.analytics_progress.config(value=0.0)
+                self.analytics_progress_label.config(text="Report failed.")
+                messagebox.showwarning("Analytics", f"Failed to build analytics report:\n{payload}")
+
+        if busy:
+            self.analytics_poll_job = self.root.after(100, self.poll_analytics)
+        else:
+            self.analytics_poll_job = None
+            self.analytics_cancel_btn.config(state=tk.DISABLED)
+
+    def finish_analytics_job(self, job):
+        record = job.record()
+        pdf_path = job.pdf_path
         try:
             self.analytics_log.append(record)
         except OSError as exc:
             messagebox.showwarning("Analytics", f"Could not store analytics record:\n{exc}")
         if hasattr(self, "analytics_tab"):
             self.analytics_tab.add_record(record)
+        self.analytics_progress.config(value=1.0)
+        self.analytics_progress_label.config(text=f"Report saved to {os.path.basename(pdf_path)}")
+        # Leave a game in progress on screen; the record is in the tab.
+        if self.timer_job is None:
             try:
-                self.content_notebook.select(self.analytics_tab.frame)
+                self.show_tab(self.analytics_page)
                 self.analytics_tab.highlight_pdf(pdf_path)
             except Exception:
                 pass
-        messagebox.showinfo("Analytics", f"Report saved to {os.path.basename(pdf_path)}")
 
     def build_score_record(self, name, won):
         difficulty = getattr(self, "difficulty_var", None)
@@ -482,12 +755,7 @@ class Minesweeper:
         }
 
     def count_white_cells(self):
-        count = 0
-        for row in self.game.grid:
-            for cell in row:
-                if not cell.is_mine and cell.neighbor_mines == 0:
-                    count += 1
-        return count
+        return self.game.zero_cells
 
     def save_score(self, name, won):
         record = self.build_score_record(name, won)
@@ -501,16 +769,29 @@ class Minesweeper:
         if hasattr(self, "highscore_panel"):
             self.highscore_panel.refresh(self.last_win_key)
 
+    def set_label_text(self, label, text):
+        # Skip the Tk round trip when the text is unchanged.
+        if self.label_texts.get(label) != text:
+            self.label_texts[label] = text
+            label.config(text=text)
+
     def update_counters(self):
-        self.mines_label.config(text=f"Mines: {self.game.flags_left:03d}")
-        self.timer_label.config(text=f"Time: {self.timer_seconds:03d}")
+        self.set_label_text(self.mines_label, f"Mines: {self.game.flags_left:03d}")
+        self.set_label_text(self.timer_label, f"Time: {self.timer_seconds:03d}")
 
     def hover(self, r, c, is_enter):
-        cell = self.game.grid[r][c]
-        btn = self.buttons[(r, c)]
-        if cell.is_revealed or cell.is_flagged:
-            return
-        btn.config(bg=self.CELL_BG_HOVER if is_enter else self.CELL_BG)
+        # Only the pointer moves here; cell_style draws the hovered cell at
+        # the next flush, so a fast sweep repaints at most two cells.
+        if is_enter:
+            trace = self.begin_trace("hover")
+            previous, self.hover_cell = self.hover_cell, (r, c)
+            if previous is not None:
+                self.mark_dirty(*previous)
+            self.mark_dirty(r, c)
+            self.await_paint(trace)
+        elif self.hover_cell == (r, c):
+            self.hover_cell = None
+            self.mark_dirty(r, c)
 
     def stop_timer(self, reset_seconds=False):
         if self.timer_job is not None:
@@ -526,7 +807,7 @@ class Minesweeper:
         def tick():
             self.timer_seconds += 1
             try:
-                self.timer_label.config(text=f"Time: {self.timer_seconds:03d}")
+                self.set_label_text(self.timer_label, f"Time: {self.timer_seconds:03d}")
             except Exception:
                 pass
             self.timer_job = self.root.after(1000, tick)
@@ -545,7 +826,28 @@ class Minesweeper:
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play Minesweeper.")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--mines", type=int, default=10)
+    parser.add_argument("--renderer", choices=sorted(BOARD_VIEWS), default="canvas")
+    parser.add_argument("--instrument", action="store_true", help="time input handling; F12 shows p50/p95/p99")
+    parser.add_argument("--latency-log", metavar="PATH", help="append one JSON line per timed operation (implies --instrument)")
+    args = parser.parse_args()
+
+    latency = None
+    if args.instrument or args.latency_log:
+        from instrumentation import LatencyRecorder
+
+        latency = LatencyRecorder(dump_path=args.latency_log)
+
     root = tk.Tk()
     root.title("Minesweeper")
-    Minesweeper(root, rows=10, cols=10, mines=10)
+    app = Minesweeper(root, rows=args.rows, cols=args.cols, mines=args.mines, renderer=args.renderer, latency=latency)
     root.mainloop()
+    # Covers exits that bypass the close button; a second shutdown is a no-op.
+    app.analytics_worker.shutdown()
+    if latency is not None:
+        latency.close()
@@ -0,0 +1,133 @@
+"""Opt-in latency instrumentation for GUI operations.
+
+A `Trace` timestamps the stages of one operation with `perf_counter_ns`.
+`LatencyRecorder` keeps the last `window` finished traces per operation
+for rolling p50/p95/p99 figures and can append every trace to a JSON-lines
+file, tagged with whatever context (board size, ...) the caller passes.
+When instrumentation is off, callers use `NULL_TRACE`, which does nothing.
+"""
+
+import json
+import math
+import time
+from collections import defaultdict, deque
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+class Trace:
+    __slots__ = ("recorder", "operation", "context", "started", "last", "stages", "done")
+
+    def __init__(self, recorder, operation: str, context: dict):
+        self.recorder = recorder
+        self.operation = operation
+        self.context = context
+        self.started = self.last = time.perf_counter_ns()
+        self.stages = {}
+        self.done = False
+
+    def stage(self, name: str):
+        """Close the stage that ran since the previous mark and call it `name`."""
+        now = time.perf_counter_ns()
+        self.stages[name] = self.stages.get(name, 0) + now - self.last
+        self.last = now
+
+    def finish(self, name: str | None = None):
+        if self.done:
+            return
+        if name is not None:
+            self.stage(name)
+        self.done = True
+        self.recorder.record(self)
+
+    def discard(self):
+        """Drop a trace whose operation was superseded before it completed."""
+        if not self.done:
+            self.done = True
+            self.recorder.discarded[self.operation] += 1
+
+
+class NullTrace:
+    def stage(self, name):
+        pass
+
+    def finish(self, name=None):
+        pass
+
+    def discard(self):
+        pass
+
+
+NULL_TRACE = NullTrace()
+
+
+class LatencyRecorder:
+    def __init__(self, window: int = 1024, dump_path: str | None = None):
+        self.window = window
+        self.totals = defaultdict(lambda: deque(maxlen=window))
+        self.stage_times = defaultdict(lambda: defaultdict(lambda: deque(maxlen=window)))
+        # Traces dropped unfinished, e.g. clicks whose paint a reset cancelled.
+        self.discarded = defaultdict(int)
+        self.dump = open(dump_path, "a", encoding="utf-8") if dump_path else None
+
+    def start(self, operation: str, **context) -> Trace:
+        return Trace(self, operation, context)
+
+    def record(self, trace: Trace):
+        total = trace.last - trace.started
+        self.totals[trace.operation].append(total)
+        stage_times = self.stage_times[trace.operation]
+        for name, elapsed in trace.stages.items():
+            stage_times[name].append(elapsed)
+        if self.dump is not None:
+            entry = {
+                "time": time.time(),
+                "operation": trace.operation,
+                **trace.context,
+                "total_ms": total / 1e6,
+                "stages_ms": {name: elapsed / 1e6 for name, elapsed in trace.stages.items()},
+            }
+            self.dump.write(json.dumps(entry) + "\n")
+            self.dump.flush()
+
+    def summary(self):
+        """{operation: {"count", "discarded", "p50", "p95", "p99", "stages": {stage: p95}}}, times in milliseconds."""
+        result = {}
+        for operation in set(self.totals) | set(self.discarded):
+            ordered = sorted(self.totals[operation])
+            result[operation] = {
+                "count": len(ordered),
+                "discarded": self.discarded[operation],
+                "p50": percentile(ordered, 0.50) / 1e6,
+                "p95": percentile(ordered, 0.95) / 1e6,
+                "p99": percentile(ordered, 0.99) / 1e6,
+                "stages": {
+                    name: percentile(sorted(values), 0.95) / 1e6
+                    for name, values in self.stage_times[operation].items()
+                },
+            }
+        return result
+
+    def format_summary(self):
+        lines = []
+        for operation, stats in sorted(self.summary().items()):
+            lines.append(
+                f"{operation:<7} n={stats['count']:<5} p50 {stats['p50']:6.2f}  "
+                f"p95 {stats['p95']:6.2f}  p99 {stats['p99']:6.2f} ms"
+                + (f"  ({stats['discarded']} dropped)" if stats["discarded"] else "")
+            )
+            slowest = sorted(stats["stages"].items(), key=lambda item: -item[1])[:3]
+            if slowest:
+                lines.append("        p95 " + ", ".join(f"{name} {ms:.2f}" for name, ms in slowest))
+        return "\n".join(lines) or "No operations timed yet."
+
+    def close(self):
+        if self.dump is not None:
+            self.dump.close()
+            self.dump = None
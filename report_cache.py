@@ -0,0 +1,88 @@
+"""On-disk cache of computed analytics stats.
+
+Entries are `.npz` files named by a hash of the report key. Reading an entry
+refreshes its modification time, so eviction drops entries older than
+`max_age` seconds first and then the least recently used ones until the
+directory fits in `max_bytes`.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+
+
+class ReportCache:
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024, max_age: float | None = 30 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key):
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.npz")
+
+    def get(self, key):
+        """Return {name: array} for `key`, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["__key__"]) != repr(key):
+                    return None
+                arrays = {name: data[name] for name in data.files if name != "__key__"}
+        except (OSError, KeyError, ValueError):
+            return None
+        os.utime(path)
+        return arrays
+
+    def put(self, key, arrays):
+        path = self.path_for(key)
+        # Write to a temporary file first so a reader never sees half an entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, __key__=np.array(repr(key)), **arrays)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def entries(self):
+        """[(mtime, size, path)] for every cached entry, oldest first."""
+        found = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            found.append((info.st_mtime, info.st_size, path))
+        found.sort()
+        return found
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        cutoff = time.time() - self.max_age if self.max_age is not None else None
+        for mtime, size, path in entries:
+            if (cutoff is None or mtime >= cutoff) and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,165 @@
+"""Headless game simulator.
+
+Plays many games with a pluggable move policy across a process pool and
+reports win rate, game length and guess rate. Runs are reproducible: every
+worker gets its own child of `np.random.SeedSequence(seed)`, and every game
+two seeds drawn from that child: one for the board, one for the policy.
+
+    python simulator.py --difficulty Expert --games 100000 --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from game_logic import DIFFICULTIES, GameCore
+from solver import solve
+
+
+def random_policy(game: GameCore, rng: random.Random):
+    """Reveal a uniformly random hidden, unflagged cell.
+
+    Every move after the (safe) first click counts as a guess.
+    """
+    revealed, flagged = game.revealed, game.flagged
+    hidden = [idx for idx in range(len(revealed)) if not revealed[idx] and not flagged[idx]]
+    r, c = divmod(rng.choice(hidden), game.cols)
+    return r, c, game.mines_placed
+
+
+def solver_policy(game: GameCore, rng: random.Random):
+    """Open a provably safe cell, else the cell least likely to be a mine."""
+    if not game.mines_placed:
+        return game.rows // 2, game.cols // 2, False
+    solution = solve(game)
+    if solution.safe:
+        r, c = solution.safe[0]
+        return r, c, False
+    probabilities = solution.probabilities
+    lowest = min(probabilities.values())
+    r, c = rng.choice([cell for cell, p in probabilities.items() if p == lowest])
+    return r, c, True
+
+
+# Policies are looked up by name so they can be sent to worker processes.
+POLICIES = {
+    "random": random_policy,
+    "solver": solver_policy,
+}
+
+
+def play_game(rows: int, cols: int, mines: int, policy, board_seed: int, policy_seed: int):
+    """Play one game to the end; returns (won, moves, guesses)."""
+    game = GameCore(rows, cols, mines, seed=board_seed)
+    rng = random.Random(policy_seed)
+    moves = guesses = 0
+    while not game.is_game_over:
+        r, c, guessed = policy(game, rng)
+        moves += 1
+        guesses += bool(guessed)
+        if not game.reveal(r, c):
+            return False, moves, guesses
+        if game.check_win():
+            return True, moves, guesses
+    return False, moves, guesses
+
+
+def run_batch(rows: int, cols: int, mines: int, policy_name: str, seed_seq: np.random.SeedSequence, games: int):
+    policy = POLICIES[policy_name]
+    # Separate board and policy seeds, so the policy's draws do not replay
+    # the Mersenne Twister output the board was dealt from.
+    seeds = seed_seq.generate_state(2 * games, dtype=np.uint64).tolist() if games else []
+    wins = moves = guesses = max_moves = 0
+    won_moves = 0
+    started = time.perf_counter()
+    for board_seed, policy_seed in zip(seeds[0::2], seeds[1::2]):
+        won, game_moves, game_guesses = play_game(rows, cols, mines, policy, board_seed, policy_seed)
+        wins += won
+        moves += game_moves
+        guesses += game_guesses
+        max_moves = max(max_moves, game_moves)
+        if won:
+            won_moves += game_moves
+    return {
+        "games": games,
+        "wins": wins,
+        "moves": moves,
+        "won_moves": won_moves,
+        "max_moves": max_moves,
+        "guesses": guesses,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def merge_batches(batches):
+    total = {"games": 0, "wins": 0, "moves": 0, "won_moves": 0, "max_moves": 0, "guesses": 0, "seconds": 0.0}
+    for batch in batches:
+        for key, value in batch.items():
+            total[key] = max(total[key], value) if key == "max_moves" else total[key] + value
+    return total
+
+
+def simulate(rows: int, cols: int, mines: int, games: int, policy: str = "random", workers: int | None = None, seed: int | None = 42):
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}; choose from {sorted(POLICIES)}")
+    if games <= 0:
+        raise ValueError("games must be positive")
+    workers = max(1, min(workers or os.cpu_count() or 1, games))
+
+    children = np.random.SeedSequence(seed).spawn(workers)
+    shares = [games // workers + (i < games % workers) for i in range(workers)]
+    jobs = [(rows, cols, mines, policy, child, share) for child, share in zip(children, shares)]
+
+    started = time.perf_counter()
+    if workers == 1:
+        batches = [run_batch(*jobs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batches = list(pool.map(run_batch, *zip(*jobs)))
+    wall = time.perf_counter() - started
+
+    total = merge_batches(batches)
+    return {
+        "rows": rows,
+        "cols": cols,
+        "mines": mines,
+        "policy": policy,
+        "workers": workers,
+        "games": total["games"],
+        "wins": total["wins"],
+        "win_rate": total["wins"] / total["games"],
+        "mean_moves": total["moves"] / total["games"],
+        "mean_moves_won": total["won_moves"] / total["wins"] if total["wins"] else 0.0,
+        "max_moves": total["max_moves"],
+        "guess_rate": total["guesses"] / total["moves"] if total["moves"] else 0.0,
+        "wall_seconds": wall,
+        "games_per_second_per_core": total["games"] / wall / workers if wall else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate headless Minesweeper games.")
+    parser.add_argument("--difficulty", choices=sorted(DIFFICULTIES), default=None, help="run one difficulty (default: all)")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    names = [args.difficulty] if args.difficulty else list(DIFFICULTIES)
+    for name in names:
+        rows, cols, mines = DIFFICULTIES[name]
+        summary = simulate(rows, cols, mines, args.games, args.policy, args.workers, args.seed)
+        print(
+            f"{name:>12}: win rate {summary['win_rate']:.2%}, "
+            f"mean moves {summary['mean_moves']:.1f}, guess rate {summary['guess_rate']:.2%}, "
+            f"{summary['games_per_second_per_core']:.0f} games/s/core on {summary['workers']} worker(s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
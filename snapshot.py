@@ -0,0 +1,116 @@
+"""Compact binary snapshots of a GameCore.
+
+Layout (little-endian):
+
+    offset 0   header, HEADER.size (32) bytes:
+               magic b"MSWP", version u8, flags u8, reserved u16,
+               rows u32, cols u32, mines u32, reserved u32, board_seed u64
+    offset 32  mine plane, then revealed plane, then flagged plane
+
+Each plane holds one bit per cell in row-major order, most significant bit
+first within a byte, and is zero-padded to a multiple of 8 bytes. Plane
+offsets depend only on the shape (see `plane_offsets`), so large snapshots
+can be memory-mapped and sliced directly.
+"""
+
+import mmap
+import struct
+
+from game_logic import GameCore
+
+MAGIC = b"MSWP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHIIIIQ")
+
+FLAG_MINES_PLACED = 1
+FLAG_GAME_OVER = 2
+FLAG_HAS_SEED = 4
+
+# bytes.translate tables between 0/1 bytes and ASCII "0"/"1".
+_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_ASCII = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def plane_size(cells: int) -> int:
+    return ((cells + 63) // 64) * 8
+
+
+def plane_offsets(rows: int, cols: int):
+    size = plane_size(rows * cols)
+    return tuple(HEADER.size + i * size for i in range(3))
+
+
+def pack_plane(plane) -> bytes:
+    """Pack a 0/1 bytearray into MSB-first bits, padded to `plane_size`."""
+    size = plane_size(len(plane))
+    if not plane:
+        return bytes(size)
+    bits = bytes(plane).translate(_TO_ASCII)
+    # int(..., 2) and to_bytes run in C, so no per-cell Python objects.
+    value = int(bits, 2) << (size * 8 - len(plane))
+    return value.to_bytes(size, "big")
+
+
+def unpack_plane(data, cells: int) -> bytearray:
+    if cells == 0:
+        return bytearray()
+    value = int.from_bytes(data[: (cells + 7) // 8], "big") >> ((8 - cells % 8) % 8)
+    return bytearray(format(value, f"0{cells}b").encode("ascii").translate(_FROM_ASCII))
+
+
+def dumps(game: GameCore) -> bytes:
+    flags = 0
+    if game.mines_placed:
+        flags |= FLAG_MINES_PLACED
+    if game.is_game_over:
+        flags |= FLAG_GAME_OVER
+    if game.board_seed is not None:
+        flags |= FLAG_HAS_SEED
+    header = HEADER.pack(
+        MAGIC, VERSION, flags, 0, game.rows, game.cols, game.mines, 0, game.board_seed or 0
+    )
+    return b"".join((header, pack_plane(game.mine), pack_plane(game.revealed), pack_plane(game.flagged)))
+
+
+def loads(data, **kwargs) -> GameCore:
+    """Rebuild a GameCore from snapshot bytes (bytes, memoryview or mmap).
+
+    Extra keyword arguments are passed to the GameCore constructor.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("snapshot is truncated")
+    magic, version, flags, _, rows, cols, mines, _, board_seed = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a minesweeper snapshot")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    cells = rows * cols
+    size = plane_size(cells)
+    offsets = plane_offsets(rows, cols)
+    if len(data) < offsets[-1] + size:
+        raise ValueError("snapshot is truncated")
+
+    game = GameCore(rows, cols, mines, **kwargs)
+    game.mine, game.revealed, game.flagged = (unpack_plane(data[off:off + size], cells) for off in offsets)
+    game.board_seed = board_seed if flags & FLAG_HAS_SEED else None
+    game.mines_placed = bool(flags & FLAG_MINES_PLACED)
+    game.is_game_over = bool(flags & FLAG_GAME_OVER)
+    if game.mines_placed:
+        game.count_neighbor_mines()
+        if game.use_openings:
+            game.label_openings()
+    for name, value in game.scan_counters().items():
+        setattr(game, name, value)
+    game.flags_left = mines - game.flags_placed
+    return game
+
+
+def save(game: GameCore, path: str):
+    with open(path, "wb") as fh:
+        fh.write(dumps(game))
+
+
+def load(path: str, **kwargs) -> GameCore:
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return loads(mapped, **kwargs)
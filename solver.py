@@ -0,0 +1,279 @@
+"""Frontier constraint solver and exact mine probabilities for GameCore.
+
+Every revealed number constrains its hidden neighbours. The hidden cells
+that touch a number (the frontier) are split into independent components,
+each component's solutions are counted by a forward/backward dynamic
+programme over its cells (cached by shape), and the components are
+recombined with the global mine count so that every hidden cell gets an
+exact mine probability. Flags are ignored;
+the solver only trusts what the board has revealed.
+"""
+
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+
+from game_logic import GameCore
+
+
+class Solution:
+    __slots__ = ("safe", "mines", "probabilities")
+
+    def __init__(self, safe, mines, probabilities):
+        # Lists of (row, col) that are certainly safe / certainly mines, and
+        # a {(row, col): probability} map for every hidden cell.
+        self.safe = safe
+        self.mines = mines
+        self.probabilities = probabilities
+
+    def best_guess(self):
+        """The hidden cell with the lowest mine probability, or None."""
+        if not self.probabilities:
+            return None
+        return min(self.probabilities, key=self.probabilities.get)
+
+
+def frontier_constraints(game: GameCore):
+    """Return {number_cell: (hidden_neighbour_indices, mines_needed)}."""
+    mine, revealed, numbers = game.mine, game.revealed, game.numbers
+    offsets, indices = game.table.offsets, game.table.indices
+    constraints = {}
+    idx = revealed.find(1)
+    while idx != -1:
+        if not mine[idx] and numbers[idx]:
+            around = indices[offsets[idx]:offsets[idx + 1]]
+            hidden = tuple(nidx for nidx in around if not revealed[nidx])
+            if hidden:
+                # A mine revealed by a losing click is already accounted for.
+                needed = numbers[idx] - sum(1 for nidx in around if revealed[nidx] and mine[nidx])
+                constraints[idx] = (hidden, needed)
+        idx = revealed.find(1, idx + 1)
+    return constraints
+
+
+def split_components(constraints):
+    """Group constraints that share frontier cells; returns [(cells, constraints)]."""
+    parent = {}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for cells, _ in constraints:
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        root = find(cells[0])
+        for cell in cells[1:]:
+            other = find(cell)
+            if other != root:
+                parent[other] = root
+
+    grouped = {}
+    for cells, needed in constraints:
+        grouped.setdefault(find(cells[0]), ([], []))[1].append((cells, needed))
+    for cell in parent:
+        grouped[find(cell)][0].append(cell)
+    return list(grouped.values())
+
+
+def canonical_component(cells, constraints):
+    """Renumber a component so equal shapes share one cache entry."""
+    # Breadth-first order over cells that share a constraint keeps the set of
+    # partially assigned constraints narrow, which bounds the DP state below.
+    adjacent = {cell: set() for cell in cells}
+    for con_cells, _ in constraints:
+        for cell in con_cells:
+            adjacent[cell].update(con_cells)
+    start = min(cells, key=lambda cell: (len(adjacent[cell]), cell))
+    order = {start: 0}
+    queue = [start]
+    for cell in queue:
+        for other in sorted(adjacent[cell]):
+            if other not in order:
+                order[other] = len(order)
+                queue.append(other)
+    local = tuple(sorted((tuple(sorted(order[cell] for cell in con_cells)), needed) for con_cells, needed in constraints))
+    ordered_cells = sorted(order, key=order.get)
+    return ordered_cells, local
+
+
+def add_into(target, source, shift=0):
+    for k, ways in source.items():
+        target[k + shift] = target.get(k + shift, 0) + ways
+
+
+@lru_cache(maxsize=4096)
+def enumerate_component(size, constraints):
+    """Count solutions of one component by mine total.
+
+    Returns {mines: (solutions, per_cell_mine_counts)} where
+    per_cell_mine_counts[i] is how many of those solutions put a mine on
+    local cell i.
+
+    Cells are assigned in order; the DP state between cell b-1 and b is the
+    outstanding mine count of every constraint that has started but not yet
+    finished. A forward pass counts partial assignments per state, a
+    backward pass counts completions, and their product at each cell gives
+    the per-cell counts without listing individual solutions.
+    """
+    first = [cells[0] for cells, _ in constraints]
+    last = [cells[-1] for cells, _ in constraints]
+    touching = [[] for _ in range(size)]
+    for ci, (cells, _) in enumerate(constraints):
+        for rank, cell in enumerate(cells):
+            touching[cell].append((ci, len(cells) - rank - 1))
+    # open_at[b]: constraints with first < b <= last, in a fixed order.
+    open_at = [[ci for ci in range(len(constraints)) if first[ci] < b <= last[ci]] for b in range(size + 1)]
+
+    def step(b, state, value):
+        need = dict(zip(open_at[b], state))
+        for ci, cells_after in touching[b]:
+            left = need.get(ci, constraints[ci][1]) - value
+            if left < 0 or left > cells_after:
+                return None
+            need[ci] = left
+        return tuple(need[ci] for ci in open_at[b + 1])
+
+    forward = [dict() for _ in range(size + 1)]
+    forward[0][()] = {0: 1}
+    for b in range(size):
+        nxt = forward[b + 1]
+        for state, ways in forward[b].items():
+            for value in (0, 1):
+                target = step(b, state, value)
+                if target is not None:
+                    add_into(nxt.setdefault(target, {}), ways, value)
+
+    backward = [None] * (size + 1)
+    backward[size] = {(): {0: 1}}
+    per_cell = [None] * size
+    for b in range(size - 1, -1, -1):
+        here = {}
+        mine_counts = {}
+        for state, ways in forward[b].items():
+            completions = {}
+            for value in (0, 1):
+                target = step(b, state, value)
+                if target is None or target not in backward[b + 1]:
+                    continue
+                after = backward[b + 1][target]
+                add_into(completions, after, value)
+                if value:
+                    for k_before, w_before in ways.items():
+                        add_into(mine_counts, {k: w * w_before for k, w in after.items()}, k_before + 1)
+            if completions:
+                here[state] = completions
+        backward[b] = here
+        per_cell[b] = mine_counts
+
+    results = {}
+    for k, solutions in backward[0].get((), {}).items():
+        results[k] = (solutions, [per_cell[b].get(k, 0) for b in range(size)])
+    return results
+
+
+def convolve(a, b):
+    out = {}
+    for ka, wa in a.items():
+        for kb, wb in b.items():
+            out[ka + kb] = out.get(ka + kb, 0) + wa * wb
+    return out
+
+
+def solve(game: GameCore) -> Solution:
+    rows, cols = game.rows, game.cols
+    revealed = game.revealed
+    hidden_total = len(revealed) - game.revealed_count
+    if not game.mines_placed:
+        uniform = game.mines / hidden_total if hidden_total else 0.0
+        probabilities = {divmod(idx, cols): uniform for idx in range(rows * cols)}
+        return Solution([], [], probabilities)
+
+    constraints = frontier_constraints(game)
+    components = []
+    frontier = set()
+    for cells, con in split_components(list(constraints.values())):
+        ordered_cells, local = canonical_component(cells, con)
+        frontier.update(ordered_cells)
+        components.append((ordered_cells, enumerate_component(len(ordered_cells), local)))
+
+    # A lost game has one revealed mine that no longer counts as hidden.
+    mines_left = game.mines - (game.revealed_count - (len(revealed) - game.mines - game.hidden_safe))
+    outside = hidden_total - len(frontier)
+
+    # distributions[i][k] = number of ways component i holds k mines.
+    distributions = [{k: solutions for k, (solutions, _) in results.items()} for _, results in components]
+    prefix = [{0: 1}]
+    for dist in distributions:
+        prefix.append(convolve(prefix[-1], dist))
+    suffix = [{0: 1}]
+    for dist in reversed(distributions):
+        suffix.append(convolve(suffix[-1], dist))
+    suffix.reverse()
+
+    def outside_ways(frontier_mines):
+        rest = mines_left - frontier_mines
+        return comb(outside, rest) if 0 <= rest <= outside else 0
+
+    total = sum(ways * outside_ways(k) for k, ways in prefix[-1].items())
+    probabilities = {}
+    safe, certain = [], []
+    if total == 0:
+        return Solution(safe, certain, probabilities)
+
+    for i, (cells, results) in enumerate(components):
+        others = convolve(prefix[i], suffix[i + 1])
+        numerators = [0] * len(cells)
+        for k, (_, counts) in results.items():
+            weight = sum(ways * outside_ways(k + j) for j, ways in others.items())
+            if weight:
+                for pos, count in enumerate(counts):
+                    numerators[pos] += count * weight
+        for cell, numerator in zip(cells, numerators):
+            rc = divmod(cell, cols)
+            probabilities[rc] = numerator / total
+            if numerator == 0:
+                safe.append(rc)
+            elif numerator == total:
+                certain.append(rc)
+
+    if outside:
+        # Every unconstrained cell is equally likely to hold the leftover mines.
+        numerator = sum(ways * outside_ways(k) * (mines_left - k) for k, ways in prefix[-1].items())
+        outside_probability = numerator / (total * outside)
+        for idx in range(rows * cols):
+            if not revealed[idx] and idx not in frontier:
+                rc = divmod(idx, cols)
+                probabilities[rc] = outside_probability
+                if numerator == 0:
+                    safe.append(rc)
+                elif numerator == total * outside:
+                    certain.append(rc)
+
+    return Solution(safe, certain, probabilities)
+
+
+def solve_reference(game: GameCore) -> dict:
+    """Mine probabilities by listing every consistent layout, kept for parity checks.
+
+    Only practical on small boards; expects a game that is still running.
+    """
+    mine, revealed, numbers = game.mine, game.revealed, game.numbers
+    offsets, indices = game.table.offsets, game.table.indices
+    hidden = [idx for idx in range(len(revealed)) if not revealed[idx]]
+    checks = [
+        (indices[offsets[idx]:offsets[idx + 1]], numbers[idx])
+        for idx in range(len(revealed))
+        if revealed[idx] and not mine[idx]
+    ]
+    counts = dict.fromkeys(hidden, 0)
+    total = 0
+    for layout in combinations(hidden, game.mines):
+        placed = set(layout)
+        if all(sum(nidx in placed for nidx in around) == number for around, number in checks):
+            total += 1
+            for idx in layout:
+                counts[idx] += 1
+    return {divmod(idx, game.cols): count / total for idx, count in counts.items()}
@@ -0,0 +1,115 @@
+"""Constant-memory accumulators for per-board report statistics.
+
+Both accumulators update from a NumPy batch and merge with another instance
+of the same shape, so workers can summarise their share independently.
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+
+
+class RunningStats:
+    """Count, mean, variance, min and max of a stream of values."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        other = RunningStats()
+        other.count = int(values.size)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self.merge(other)
+
+    def merge(self, other):
+        """Fold `other` into this accumulator (Chan et al. pairwise update)."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def to_array(self):
+        """(count, mean, m2, min, max) as float64, for saving with NumPy."""
+        empty = self.count == 0
+        return np.array(
+            [self.count, self.mean, self.m2, np.nan if empty else self.min, np.nan if empty else self.max],
+            dtype=np.float64,
+        )
+
+    @classmethod
+    def from_array(cls, array):
+        stats = cls()
+        count, mean, m2, low, high = (float(v) for v in array)
+        stats.count, stats.mean, stats.m2 = int(count), mean, m2
+        if stats.count:
+            stats.min, stats.max = low, high
+        return stats
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return self.variance ** 0.5
+
+    def confidence_interval(self, level=0.95):
+        """Normal-approximation interval for the mean."""
+        if self.count == 0:
+            return (float("nan"), float("nan"))
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        half = z * self.std / self.count ** 0.5
+        return (self.mean - half, self.mean + half)
+
+
+class FixedHistogram:
+    """Counts of integer values in [0, bins); anything outside is clipped."""
+
+    def __init__(self, bins):
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, values):
+        values = np.clip(np.asarray(values, dtype=np.int64).ravel(), 0, self.counts.size - 1)
+        self.counts += np.bincount(values, minlength=self.counts.size)
+
+    def merge(self, other):
+        if other.counts.size != self.counts.size:
+            raise ValueError("histograms have different bin counts")
+        self.counts += other.counts
+        return self
+
+    def to_array(self):
+        return self.counts.copy()
+
+    @classmethod
+    def from_array(cls, array):
+        histogram = cls(len(array))
+        histogram.counts += np.asarray(array, dtype=np.int64)
+        return histogram
+
+    def occupied_range(self):
+        """(first, last) bin with a non-zero count, or (0, 0) when empty."""
+        nonzero = np.flatnonzero(self.counts)
+        if nonzero.size == 0:
+            return (0, 0)
+        return (int(nonzero[0]), int(nonzero[-1]))
@@ -0,0 +1,62 @@
+"""Parity of the vectorised analytics against their per-cell references."""
+
+import numpy as np
+import pytest
+
+import analytics
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (1, 7), (9, 9), (16, 30), (40, 23)])
+@pytest.mark.parametrize("density", [0.0, 0.2, 0.5, 1.0])
+def test_count_neighbor_mines_matches_reference(rows, cols, density):
+    rng = np.random.default_rng(rows * 100 + cols)
+    mask = rng.random((rows, cols)) < density
+    expected = analytics.count_neighbor_mines_reference(mask)
+    actual = analytics.count_neighbor_mines(mask)
+    assert actual.dtype == expected.dtype
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_count_neighbor_mines_accepts_integer_masks():
+    mask = np.array([[0, 1, 0], [0, 0, 0], [1, 0, 0]], dtype=np.uint8)
+    np.testing.assert_array_equal(analytics.count_neighbor_mines(mask), [[1, 0, 1], [2, 2, 1], [0, 1, 0]])
+    np.testing.assert_array_equal(
+        analytics.count_neighbor_mines(mask), analytics.count_neighbor_mines_reference(mask.astype(bool))
+    )
+
+
+def test_count_neighbor_mines_batches_match_single_boards():
+    masks = np.random.default_rng(3).random((8, 12, 17)) < 0.3
+    batched = analytics.count_neighbor_mines(masks)
+    for mask, numbers in zip(masks, batched):
+        np.testing.assert_array_equal(numbers, analytics.count_neighbor_mines_reference(mask))
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (9, 9), (16, 30), (30, 17)])
+@pytest.mark.parametrize("density", [0.0, 0.1, 0.2, 0.4, 0.6, 0.8, 1.0])
+def test_mine_cluster_stats_match_reference(rows, cols, density):
+    masks = np.random.default_rng(13).random((24, rows, cols)) < density
+    expected = [analytics.count_mine_clusters_reference(mask) for mask in masks]
+    counts, sizes = analytics.mine_cluster_stats(masks)
+    assert counts.tolist() == expected
+    assert len(sizes) == sum(expected)
+    assert sizes.sum() == masks.sum()
+    assert analytics.count_mine_clusters(masks[0]) == expected[0]
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (9, 9), (16, 30)])
+@pytest.mark.parametrize("radius", [0, 1, 2, 3])
+def test_mines_in_local_region_matches_reference(rows, cols, radius):
+    masks = np.random.default_rng(17).random((6, rows, cols)) < 0.2
+    expected = np.stack([analytics.mines_in_local_region_reference(mask, radius) for mask in masks])
+    batched = analytics.mines_in_local_region(masks, radius)
+    assert batched.dtype == expected.dtype
+    np.testing.assert_array_equal(batched, expected)
+    np.testing.assert_array_equal(analytics.mines_in_local_region(masks[0], radius), expected[0])
+    # The report filters summed mine frequencies rather than a single mask.
+    np.testing.assert_array_equal(analytics.box_sum(masks.sum(axis=0), radius), expected.sum(axis=0))
+
+
+def test_box_sum_rejects_negative_radius():
+    with pytest.raises(ValueError):
+        analytics.box_sum(np.zeros((3, 3)), -1)
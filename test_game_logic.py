@@ -0,0 +1,44 @@
+"""GameCore counter consistency under seeded random play."""
+
+import random
+
+import pytest
+
+from game_logic import GameCore
+
+
+@pytest.mark.parametrize("openings", [False, True])
+@pytest.mark.parametrize("seed", range(40))
+def test_random_play_keeps_counters_consistent(seed, openings):
+    # check_counters=True makes every mutation re-derive the counters and
+    # raise AssertionError on a mismatch.
+    rng = random.Random(seed)
+    rows, cols = rng.randint(2, 20), rng.randint(2, 30)
+    mines = rng.randint(0, rows * cols - 1)
+    game = GameCore(rows, cols, mines, check_counters=True, openings=openings, seed=rng.getrandbits(63))
+    for _ in range(80):
+        r, c = rng.randrange(rows), rng.randrange(cols)
+        move = rng.random()
+        if move < 0.05:
+            game.reset()
+        elif game.is_game_over:
+            continue
+        elif move < 0.55:
+            game.reveal(r, c)
+        elif move < 0.65:
+            game.reveal_many([(rng.randrange(rows), rng.randrange(cols)) for _ in range(3)])
+        elif move < 0.85:
+            game.toggle_flag(r, c)
+        else:
+            game.chord(r, c)
+        if not game.is_game_over:
+            game.check_win()
+    game.verify_counters()
+
+
+def test_verify_counters_detects_drift():
+    game = GameCore(5, 5, 3, seed=1)
+    game.reveal(2, 2)
+    game.hidden_safe += 1
+    with pytest.raises(AssertionError):
+        game.verify_counters()
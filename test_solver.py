@@ -0,0 +1,44 @@
+"""solve() against brute-force enumeration on small positions."""
+
+import random
+
+import pytest
+
+import solver
+from game_logic import GameCore
+from simulator import solver_policy
+
+
+def small_positions(count, seed):
+    """Mid-game positions on boards small enough to enumerate every layout."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        rows, cols = rng.randint(2, 5), rng.randint(3, 5)
+        mines = rng.randint(1, min(6, rows * cols - 2))
+        game = GameCore(rows, cols, mines, seed=rng.getrandbits(63))
+        for _ in range(rng.randint(1, 4)):
+            r, c, _ = solver_policy(game, rng)
+            if not game.reveal(r, c) or game.check_win():
+                break
+        if not game.is_game_over:
+            positions.append(game)
+    return positions
+
+
+@pytest.mark.parametrize("game", small_positions(300, seed=19))
+def test_solve_matches_brute_force(game):
+    expected = solver.solve_reference(game)
+    solution = solver.solve(game)
+    assert solution.probabilities.keys() == expected.keys()
+    for cell, probability in expected.items():
+        assert solution.probabilities[cell] == pytest.approx(probability, abs=1e-9)
+        assert (cell in solution.safe) == (probability == 0)
+        assert (cell in solution.mines) == (probability == 1)
+
+
+def test_solve_before_first_click_is_uniform():
+    game = GameCore(4, 5, 4, seed=1)
+    solution = solver.solve(game)
+    assert set(solution.probabilities.values()) == {4 / 20}
+    assert not solution.safe and not solution.mines